@@ -36,6 +36,15 @@ pytest_plugins = [
 ]
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache, so cached billing plans and webhook event claims don't leak."""
+    from django.core.cache import cache
+
+    cache.clear()
+    yield
+
+
 @pytest.fixture(scope="module")
 def anyio_backend():
     """Configure anyio to use asyncio backend only for async tests."""
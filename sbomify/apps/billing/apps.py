@@ -9,6 +9,8 @@ class BillingConfig(AppConfig):
     label = "billing"
 
     def ready(self):
+        import sbomify.apps.billing.signals  # noqa: F401
+
         # Only set Stripe API key if billing is enabled
         if getattr(settings, "BILLING", True):
             # This ensures stripe.api_key is set when Django starts
@@ -3,10 +3,15 @@ Module for handling Stripe billing webhook events and related processing
 """
 
 import datetime
+import logging
 from functools import wraps
 
 import stripe
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, Count, OuterRef, Q, Subquery, When
+from django.db.models.functions import Coalesce
 from django.http import HttpResponse, HttpResponseForbidden, JsonResponse
 from django.utils import timezone
 
@@ -15,15 +20,35 @@ from sbomify.apps.teams.models import Member, Team
 from sbomify.logging import getLogger
 
 from . import email_notifications
+from .cache import get_plan
 from .config import get_unlimited_plan_limits, is_billing_enabled
 from .models import BillingPlan
-from .stripe_client import StripeClient, StripeError
+from .stripe_client import StripeClient, StripeError, describe_stripe_error
 
 logger = getLogger(__name__)
 
 # Initialize Stripe client
 stripe_client = StripeClient()
 
+# Owner notification sent when a subscription update lands in a given status:
+# status -> (email_notifications function, extra arguments, log level, log message).
+# Notifiers are looked up by name at call time so tests can patch email_notifications.
+SUBSCRIPTION_STATUS_NOTIFICATIONS = {
+    "past_due": ("notify_payment_past_due", (), logging.WARNING, "Payment past due notification"),
+    "active": ("notify_payment_succeeded", (), logging.INFO, "Payment restored notification"),
+    "canceled": ("notify_subscription_cancelled", (), logging.INFO, "Subscription cancelled notification"),
+    "incomplete": ("notify_payment_failed", (None,), logging.WARNING, "Initial payment failed notification"),
+    "incomplete_expired": (
+        "notify_payment_failed",
+        (None,),
+        logging.WARNING,
+        "Initial payment failed notification",
+    ),
+}
+
+# Stripe retries failed deliveries for up to three days, but nearly all duplicates arrive within a day
+STRIPE_EVENT_DEDUP_TIMEOUT = 86400  # 24 hours
+
 
 def check_billing_limits(resource_type: str):
     """
@@ -59,49 +84,63 @@ def check_billing_limits(resource_type: str):
                 return HttpResponseForbidden("No active billing plan")
 
             try:
-                plan = BillingPlan.objects.get(key=team.billing_plan)
+                plan = get_plan(team.billing_plan)
             except BillingPlan.DoesNotExist:
                 return HttpResponseForbidden("Invalid billing plan")
 
-            # Check limits based on resource type
+            # Unlimited plans never touch the resource tables
+            if plan.is_unlimited:
+                return view_func(request, *args, **kwargs)
+
+            # Get the limit for this resource type
             if resource_type == "product":
-                current_count = Product.objects.filter(team=team).count()
-                max_allowed = plan.max_products
+                model_class, max_allowed = Product, plan.max_products
             elif resource_type == "project":
-                current_count = Project.objects.filter(team=team).count()
-                max_allowed = plan.max_projects
+                model_class, max_allowed = Project, plan.max_projects
             elif resource_type == "component":
-                current_count = Component.objects.filter(team=team).count()
-                max_allowed = plan.max_components
+                model_class, max_allowed = Component, plan.max_components
             else:
                 return HttpResponseForbidden("Invalid resource type")
 
-            # Enterprise plan or None (unlimited) values have no limits
-            if plan.key == "enterprise" or max_allowed is None:
+            # A None limit means this resource type is unlimited
+            if max_allowed is None:
                 return view_func(request, *args, **kwargs)
 
-            # Check if limit is reached
-            if current_count >= max_allowed:
-                error_message = f"You have reached the maximum {max_allowed} {resource_type}s allowed by your plan"
+            # The team row stays locked from the count until the view has created the resource,
+            # so concurrent requests cannot all pass the check for the last free slot
+            with transaction.atomic():
+                team = Team.objects.select_for_update().get(pk=team.pk)
 
-                # Return JSON response for AJAX requests
-                is_ajax = (
-                    request.headers.get("Accept") == "application/json"
-                    or request.META.get("HTTP_X_REQUESTED_WITH") == "XMLHttpRequest"
-                )
-                if is_ajax:
-                    return JsonResponse({"error": error_message, "limit_reached": True}, status=403)
+                # Only whether the limit is reached matters, so the count is capped at the limit
+                current_count = model_class.objects.filter(team=team)[:max_allowed].count()
+
+                # Check if limit is reached
+                if current_count >= max_allowed:
+                    error_message = f"You have reached the maximum {max_allowed} {resource_type}s allowed by your plan"
 
-                # Traditional response for non-AJAX requests
-                return HttpResponseForbidden(error_message)
+                    # Return JSON response for AJAX requests
+                    is_ajax = (
+                        request.headers.get("Accept") == "application/json"
+                        or request.META.get("HTTP_X_REQUESTED_WITH") == "XMLHttpRequest"
+                    )
+                    if is_ajax:
+                        return JsonResponse({"error": error_message, "limit_reached": True}, status=403)
 
-            return view_func(request, *args, **kwargs)
+                    # Traditional response for non-AJAX requests
+                    return HttpResponseForbidden(error_message)
+
+                return view_func(request, *args, **kwargs)
 
         return _wrapped_view
 
     return decorator
 
 
+def _get_team_owners(team) -> list[Member]:
+    """Fetch a team's owners with their users in a single query."""
+    return list(Member.objects.filter(team=team, role="owner").select_related("user"))
+
+
 def _handle_stripe_error(func):
     """Decorator to handle Stripe errors consistently."""
 
@@ -109,24 +148,10 @@ def _handle_stripe_error(func):
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except stripe.error.CardError as e:
-            logger.error(f"Card error: {str(e)}")
-            raise StripeError(f"Card error: {e.user_message}")
-        except stripe.error.RateLimitError as e:
-            logger.error(f"Rate limit error: {str(e)}")
-            raise StripeError("Too many requests made to Stripe API")
-        except stripe.error.InvalidRequestError as e:
-            logger.error(f"Invalid request error: {str(e)}")
-            raise StripeError(f"Invalid request: {str(e)}")
-        except stripe.error.AuthenticationError as e:
-            logger.error(f"Authentication error: {str(e)}")
-            raise StripeError("Authentication with Stripe failed")
-        except stripe.error.APIConnectionError as e:
-            logger.error(f"API connection error: {str(e)}")
-            raise StripeError("Could not connect to Stripe API")
         except stripe.error.StripeError as e:
-            logger.error(f"Stripe error: {str(e)}")
-            raise StripeError(f"Stripe error: {str(e)}")
+            log_label, message = describe_stripe_error(e)
+            logger.error(f"{log_label}: {str(e)}")
+            raise StripeError(message)
         except Exception as e:
             logger.exception(f"Unexpected error: {str(e)}")
             raise StripeError(f"Unexpected error: {str(e)}")
@@ -152,34 +177,78 @@ def verify_stripe_webhook(request):
         return False
 
 
+def _stripe_event_cache_key(event_id: str) -> str:
+    return f"stripe_event:{event_id}"
+
+
+def claim_stripe_event(event) -> bool:
+    """
+    Atomically mark a Stripe event as being processed.
+
+    Returns:
+        False if the event was already claimed by an earlier delivery, True otherwise
+    """
+    event_id = getattr(event, "id", None)
+    if not event_id:
+        return True
+    return cache.add(_stripe_event_cache_key(event_id), True, timeout=STRIPE_EVENT_DEDUP_TIMEOUT)
+
+
+def release_stripe_event(event) -> None:
+    """Forget a claimed Stripe event so that a retried delivery gets processed."""
+    event_id = getattr(event, "id", None)
+    if event_id:
+        cache.delete(_stripe_event_cache_key(event_id))
+
+
+def _apply_trial_period(subscription, team) -> list[tuple]:
+    """
+    Record a trialing subscription's trial state on the team, without saving it.
+
+    Returns:
+        The owner notifications the trial state calls for, as (email_notifications function name,
+        extra arguments, log level, log message) tuples, so callers can send them outside their transaction
+    """
+    trial_end = datetime.datetime.fromtimestamp(subscription.trial_end, tz=datetime.timezone.utc)
+    days_remaining = (trial_end - timezone.now()).days
+
+    # Update trial status
+    team.billing_plan_limits.update(
+        {"is_trial": True, "trial_end": subscription.trial_end, "trial_days_remaining": days_remaining}
+    )
+
+    notifications = []
+
+    # Handle trial ending soon
+    if days_remaining <= settings.TRIAL_ENDING_NOTIFICATION_DAYS:
+        notifications.append(("notify_trial_ending", (days_remaining,), logging.INFO, "Trial ending notification"))
+
+    # Handle trial expired
+    if days_remaining <= 0:
+        team.billing_plan_limits.update({"is_trial": False, "subscription_status": "canceled"})
+        notifications.append(("notify_trial_expired", (), logging.INFO, "Trial expired notification"))
+
+    return notifications
+
+
+def _send_owner_notifications(team, notifications) -> None:
+    """Send owner notifications collected by a handler, fetching the team's owners once."""
+    if not notifications:
+        return
+
+    team_owners = _get_team_owners(team)
+    for notifier_name, notifier_args, log_level, log_message in notifications:
+        getattr(email_notifications, notifier_name)(team, team_owners, *notifier_args)
+        logger.log(log_level, f"{log_message} sent for team {team.key}")
+
+
 @_handle_stripe_error
 def handle_trial_period(subscription, team):
     """Handle trial period status and notifications."""
     if subscription.status == "trialing" and subscription.trial_end:
-        trial_end = datetime.datetime.fromtimestamp(subscription.trial_end, tz=datetime.timezone.utc)
-        days_remaining = (trial_end - timezone.now()).days
-
-        # Update trial status
-        team.billing_plan_limits.update(
-            {"is_trial": True, "trial_end": subscription.trial_end, "trial_days_remaining": days_remaining}
-        )
-
-        # Handle trial ending soon
-        if days_remaining <= settings.TRIAL_ENDING_NOTIFICATION_DAYS:
-            team_owners = Member.objects.filter(team=team, role="owner")
-            for member in team_owners:
-                email_notifications.notify_trial_ending(team, member, days_remaining)
-                logger.info(f"Trial ending notification sent for team {team.key} to {member.user.email}")
-
-        # Handle trial expired
-        if days_remaining <= 0:
-            team.billing_plan_limits.update({"is_trial": False, "subscription_status": "canceled"})
-            team_owners = Member.objects.filter(team=team, role="owner")
-            for member in team_owners:
-                email_notifications.notify_trial_expired(team, member)
-                logger.info(f"Trial expired notification sent for team {team.key} to {member.user.email}")
-
-        team.save()
+        notifications = _apply_trial_period(subscription, team)
+        team.save(update_fields=["billing_plan_limits"])
+        _send_owner_notifications(team, notifications)
         return True
     return False
 
@@ -188,23 +257,45 @@ def handle_trial_period(subscription, team):
 def handle_subscription_updated(subscription):
     """Handle subscription updated events."""
     try:
-        # First try to find by subscription ID
-        try:
-            team = Team.objects.get(billing_plan_limits__stripe_subscription_id=subscription.id)
-        except Team.DoesNotExist:
-            # Recovery: Try to find team by customer ID
-            try:
-                team = Team.objects.get(billing_plan_limits__stripe_customer_id=subscription.customer)
+        # Owner emails are only sent once the transaction below has committed and released the row lock
+        notifications = []
+
+        # The team row is locked for the read-modify-write of billing_plan_limits, so concurrent
+        # webhooks for the same team apply one after another
+        with transaction.atomic():
+            # Look up and lock by subscription ID and, as a recovery, by customer ID in one query,
+            # preferring a subscription ID match when both exist. Two rows are fetched so that
+            # teams sharing an ID are reported instead of one of them being picked arbitrarily.
+            subscription_match = Q(billing_plan_limits__stripe_subscription_id=subscription.id)
+            candidates = list(
+                Team.objects.select_for_update()
+                .filter(subscription_match | Q(billing_plan_limits__stripe_customer_id=subscription.customer))
+                .order_by(Case(When(subscription_match, then=0), default=1))[:2]
+            )
+            matched_by_subscription = [
+                candidate.billing_plan_limits.get("stripe_subscription_id") == subscription.id
+                for candidate in candidates
+            ]
+            if len(candidates) > 1 and matched_by_subscription[0] == matched_by_subscription[1]:
+                logger.error(
+                    "Multiple teams match %s %s",
+                    "subscription" if matched_by_subscription[0] else "customer",
+                    subscription.id if matched_by_subscription[0] else subscription.customer,
+                )
+                raise Team.MultipleObjectsReturned(f"Multiple teams found for subscription {subscription.id}")
+            team = candidates[0] if candidates else None
+
+            if team is not None and not matched_by_subscription[0]:
                 logger.warning(
                     "Found team by customer ID instead of subscription ID for subscription %s",
                     subscription.id,
                 )
-            except Team.DoesNotExist:
+            elif team is None:
                 # Recovery: Try to find team by metadata in customer
                 try:
                     customer = stripe_client.get_customer(subscription.customer)
                     if customer.metadata and "team_key" in customer.metadata:
-                        team = Team.objects.get(key=customer.metadata["team_key"])
+                        team = Team.objects.select_for_update().get(key=customer.metadata["team_key"])
                         logger.warning(f"Found team by customer metadata for subscription {subscription.id}")
                     else:
                         raise Team.DoesNotExist("No team key in customer metadata")
@@ -212,64 +303,45 @@ def handle_subscription_updated(subscription):
                     logger.error(f"Failed to recover team for subscription {subscription.id}: {str(e)}")
                     raise StripeError(f"No team found for subscription {subscription.id}")
 
-        # Validate subscription status
-        valid_statuses = ["trialing", "active", "past_due", "canceled", "incomplete", "incomplete_expired"]
-        if subscription.status not in valid_statuses:
-            raise StripeError(f"Invalid subscription status: {subscription.status}")
+            # Validate subscription status
+            valid_statuses = ["trialing", "active", "past_due", "canceled", "incomplete", "incomplete_expired"]
+            if subscription.status not in valid_statuses:
+                raise StripeError(f"Invalid subscription status: {subscription.status}")
 
-        # Update subscription status and ensure subscription ID is set
-        team.billing_plan_limits["subscription_status"] = subscription.status
-        team.billing_plan_limits["stripe_subscription_id"] = subscription.id  # Ensure this is set
-        team.billing_plan_limits["last_updated"] = timezone.now().isoformat()
+            # Update subscription status and ensure subscription ID is set
+            team.billing_plan_limits["subscription_status"] = subscription.status
+            team.billing_plan_limits["stripe_subscription_id"] = subscription.id  # Ensure this is set
+            team.billing_plan_limits["last_updated"] = timezone.now().isoformat()
 
-        # Handle trial period
-        if subscription.status == "trialing" and subscription.trial_end:
-            handle_trial_period(subscription, team)
+            # Handle trial period
+            if subscription.status == "trialing" and subscription.trial_end:
+                notifications.extend(_apply_trial_period(subscription, team))
+
+            # Update billing plan based on subscription's product
+            if subscription.items.data:
+                try:
+                    # Get plan from metadata
+                    plan_key = subscription.metadata.get("plan_key", "business")
+                    plan = get_plan(plan_key)
+                    team.billing_plan = plan.key
+                    team.billing_plan_limits.update(
+                        {
+                            "max_products": plan.max_products,
+                            "max_projects": plan.max_projects,
+                            "max_components": plan.max_components,
+                        }
+                    )
+                except BillingPlan.DoesNotExist:
+                    logger.error(f"Billing plan {plan_key} not found")
+                    raise StripeError(f"Billing plan {plan_key} not found")
+
+            team.save(update_fields=["billing_plan", "billing_plan_limits"])
+
+        notification = SUBSCRIPTION_STATUS_NOTIFICATIONS.get(subscription.status)
+        if notification:
+            notifications.append(notification)
+        _send_owner_notifications(team, notifications)
 
-        # Update billing plan based on subscription's product
-        if subscription.items.data:
-            try:
-                # Get plan from metadata
-                plan_key = subscription.metadata.get("plan_key", "business")
-                plan = BillingPlan.objects.get(key=plan_key)
-                team.billing_plan = plan.key
-                team.billing_plan_limits.update(
-                    {
-                        "max_products": plan.max_products,
-                        "max_projects": plan.max_projects,
-                        "max_components": plan.max_components,
-                    }
-                )
-            except BillingPlan.DoesNotExist:
-                logger.error(f"Billing plan {plan_key} not found")
-                raise StripeError(f"Billing plan {plan_key} not found")
-
-        # Handle specific status transitions
-        if subscription.status == "past_due":
-            team_owners = Member.objects.filter(team=team, role="owner")
-            for member in team_owners:
-                email_notifications.notify_payment_past_due(team, member)
-                logger.warning(f"Payment past due notification sent for team {team.key} to {member.user.email}")
-
-        elif subscription.status == "active":
-            team_owners = Member.objects.filter(team=team, role="owner")
-            for member in team_owners:
-                email_notifications.notify_payment_succeeded(team, member)
-                logger.info(f"Payment restored notification sent for team {team.key} to {member.user.email}")
-
-        elif subscription.status == "canceled":
-            team_owners = Member.objects.filter(team=team, role="owner")
-            for member in team_owners:
-                email_notifications.notify_subscription_cancelled(team, member)
-                logger.info(f"Subscription cancelled notification sent for team {team.key} to {member.user.email}")
-
-        elif subscription.status in ["incomplete", "incomplete_expired"]:
-            team_owners = Member.objects.filter(team=team, role="owner")
-            for member in team_owners:
-                email_notifications.notify_payment_failed(team, member, None)
-                logger.warning(f"Initial payment failed notification sent for team {team.key} to {member.user.email}")
-
-        team.save()
         logger.info(f"Updated subscription status for team {team.key} to {subscription.status}")
 
     except Team.DoesNotExist:
@@ -280,25 +352,30 @@ def handle_subscription_updated(subscription):
         raise StripeError(f"Error processing subscription update: {str(e)}")
 
 
+def _set_subscription_status(subscription_id: str, status: str) -> Team:
+    """
+    Record a new subscription status on the subscription's team.
+
+    The row is locked for the read-modify-write of billing_plan_limits, and only that column is written.
+    """
+    with transaction.atomic():
+        team = Team.objects.select_for_update().get(billing_plan_limits__stripe_subscription_id=subscription_id)
+        team.billing_plan_limits["subscription_status"] = status
+        team.billing_plan_limits["last_updated"] = timezone.now().isoformat()
+        team.save(update_fields=["billing_plan_limits"])
+    return team
+
+
 @_handle_stripe_error
 def handle_subscription_deleted(subscription):
     """Handle subscription deletion events"""
     try:
-        team = Team.objects.get(billing_plan_limits__stripe_subscription_id=subscription.id)
-
-        # Update subscription status
-        team.billing_plan_limits["subscription_status"] = "canceled"
-        # Add/update the last_updated timestamp
-        team.billing_plan_limits["last_updated"] = timezone.now().isoformat()
-
-        # Save the changes
-        team.save()
+        team = _set_subscription_status(subscription.id, "canceled")
 
         # Notify team owners
-        team_owners = Member.objects.filter(team=team, role="owner")
-        for member in team_owners:
-            email_notifications.notify_subscription_ended(team, member)
-            logger.info(f"Subscription ended notification sent for team {team.key} to {member.user.email}")
+        team_owners = _get_team_owners(team)
+        email_notifications.notify_subscription_ended(team, team_owners)
+        logger.info(f"Subscription ended notification sent for team {team.key}")
 
         logger.info(f"Subscription canceled for team {team.key}")
 
@@ -310,68 +387,69 @@ def handle_subscription_deleted(subscription):
 @_handle_stripe_error
 def handle_payment_failed(invoice):
     """Handle payment failure events"""
-    if not hasattr(invoice, "subscription") or not invoice.subscription:
+    subscription_id = getattr(invoice, "subscription", None)
+    if not subscription_id:
         logger.error("No subscription found in invoice")
         return
 
     try:
-        team = Team.objects.get(billing_plan_limits__stripe_subscription_id=invoice.subscription)
-
-        # Update status and timestamp
-        team.billing_plan_limits["subscription_status"] = "past_due"
-        team.billing_plan_limits["last_updated"] = timezone.now().isoformat()
-        team.save()
+        team = _set_subscription_status(subscription_id, "past_due")
 
         # Notify team owners
-        team_owners = Member.objects.filter(team=team, role="owner")
-        for member in team_owners:
-            email_notifications.notify_payment_failed(team, member, invoice.id)
-            logger.warning(f"Payment failed notification sent for team {team.key} to {member.user.email}")
+        team_owners = _get_team_owners(team)
+        email_notifications.notify_payment_failed(team, team_owners, invoice.id)
+        logger.warning(f"Payment failed notification sent for team {team.key}")
 
         logger.warning(f"Payment failed for team {team.key}")
 
     except Team.DoesNotExist:
-        logger.error(f"No team found for subscription {invoice.subscription}")
-        raise StripeError(f"No team found for subscription {invoice.subscription}")
+        logger.error(f"No team found for subscription {subscription_id}")
+        raise StripeError(f"No team found for subscription {subscription_id}")
 
 
 @_handle_stripe_error
 def handle_payment_succeeded(invoice):
     """Handle payment success events"""
-    if not hasattr(invoice, "subscription") or not invoice.subscription:
+    subscription_id = getattr(invoice, "subscription", None)
+    if not subscription_id:
         logger.error("No subscription found in invoice")
         return
 
     try:
-        team = Team.objects.get(billing_plan_limits__stripe_subscription_id=invoice.subscription)
-
-        # Update status and timestamp
-        team.billing_plan_limits["subscription_status"] = "active"
-        team.billing_plan_limits["last_updated"] = timezone.now().isoformat()
-        team.save()
+        team = _set_subscription_status(subscription_id, "active")
 
         # Notify team owners
-        team_owners = Member.objects.filter(team=team, role="owner")
-        for member in team_owners:
-            email_notifications.notify_payment_succeeded(team, member)
-            logger.info(f"Payment successful notification sent for team {team.key} to {member.user.email}")
+        team_owners = _get_team_owners(team)
+        email_notifications.notify_payment_succeeded(team, team_owners)
+        logger.info(f"Payment successful notification sent for team {team.key}")
 
     except Team.DoesNotExist:
-        logger.error(f"No team found for subscription {invoice.subscription}")
-        raise StripeError(f"No team found for subscription {invoice.subscription}")
+        logger.error(f"No team found for subscription {subscription_id}")
+        raise StripeError(f"No team found for subscription {subscription_id}")
+
+
+def _team_resource_count(model_class):
+    """Build a correlated subquery counting a team's rows of the given resource model."""
+    counts = model_class.objects.filter(team=OuterRef("pk")).order_by().values("team").annotate(count=Count("pk"))
+    return Coalesce(Subquery(counts.values("count")), 0)
 
 
 def can_downgrade_to_plan(team, plan):
     """Check if team can downgrade to specified plan."""
     # If the plan has no limits, always allow downgrade
-    if plan.max_products is None and plan.max_projects is None and plan.max_components is None:
+    if plan.is_unlimited:
         return True, ""
 
-    current_usage = {
-        "products": Product.objects.filter(team=team).count(),
-        "projects": Project.objects.filter(team=team).count(),
-        "components": Component.objects.filter(team=team).count(),
-    }
+    # All three counts come back from a single query as correlated subqueries
+    current_usage = (
+        Team.objects.filter(pk=team.pk)
+        .values(
+            products=_team_resource_count(Product),
+            projects=_team_resource_count(Project),
+            components=_team_resource_count(Component),
+        )
+        .get()
+    )
 
     exceeded_limits = []
     if plan.max_products is not None and current_usage["products"] > plan.max_products:
@@ -407,7 +485,7 @@ def get_current_limits(team):
         return get_unlimited_plan_limits()
 
     try:
-        plan = BillingPlan.objects.get(key=team.billing_plan)
+        plan = get_plan(team.billing_plan)
         return {
             "max_products": plan.max_products,
             "max_projects": plan.max_projects,
@@ -436,10 +514,13 @@ def handle_checkout_completed(session):
 
         # Get plan from metadata
         plan_key = session.metadata.get("plan_key", "business")
-        plan = BillingPlan.objects.get(key=plan_key)
+        plan = get_plan(plan_key)
 
-        # Get the subscription
-        subscription = stripe_client.get_subscription(session.subscription)
+        # Sessions fetched with expand=["subscription"] already carry the subscription object;
+        # only webhook payloads with a bare subscription ID need the extra Stripe API call
+        subscription = session.subscription
+        if isinstance(subscription, str):
+            subscription = stripe_client.get_subscription(subscription)
 
         # Update team billing information
         team.billing_plan = plan.key
@@ -448,7 +529,7 @@ def handle_checkout_completed(session):
             "max_projects": plan.max_projects,
             "max_components": plan.max_components,
             "stripe_customer_id": session.customer,
-            "stripe_subscription_id": session.subscription,
+            "stripe_subscription_id": subscription.id,
             "subscription_status": subscription.status,
             "last_updated": timezone.now().isoformat(),
         }
@@ -458,7 +539,7 @@ def handle_checkout_completed(session):
             billing_limits.update({"is_trial": True, "trial_end": subscription.trial_end})
 
         team.billing_plan_limits = billing_limits
-        team.save()
+        team.save(update_fields=["billing_plan", "billing_plan_limits"])
 
         # Handle trial period notifications
         if subscription.status == "trialing":
@@ -477,6 +558,25 @@ def handle_checkout_completed(session):
         raise StripeError(f"Error processing checkout: {str(e)}")
 
 
+# Stripe event type -> handler receiving the event's data object
+STRIPE_EVENT_HANDLERS = {
+    "checkout.session.completed": handle_checkout_completed,
+    "customer.subscription.updated": handle_subscription_updated,
+    "customer.subscription.deleted": handle_subscription_deleted,
+    "invoice.payment_failed": handle_payment_failed,
+    "invoice.payment_succeeded": handle_payment_succeeded,
+}
+
+
+def dispatch_stripe_event(event):
+    """Route a verified Stripe event to its handler."""
+    handler = STRIPE_EVENT_HANDLERS.get(event.type)
+    if handler is None:
+        logger.info(f"Unhandled event type: {event.type}")
+        return
+    handler(event.data.object)
+
+
 @_handle_stripe_error
 def stripe_webhook(request):
     """Handle Stripe webhook events."""
@@ -484,21 +584,14 @@ def stripe_webhook(request):
     if not event:
         return HttpResponseForbidden("Invalid signature")
 
-    try:
-        if event.type == "checkout.session.completed":
-            handle_checkout_completed(event.data.object)
-        elif event.type == "customer.subscription.updated":
-            handle_subscription_updated(event.data.object)
-        elif event.type == "customer.subscription.deleted":
-            handle_subscription_deleted(event.data.object)
-        elif event.type == "invoice.payment_failed":
-            handle_payment_failed(event.data.object)
-        elif event.type == "invoice.payment_succeeded":
-            handle_payment_succeeded(event.data.object)
-        else:
-            logger.info(f"Unhandled event type: {event.type}")
+    if not claim_stripe_event(event):
+        logger.info(f"Skipping already processed Stripe event {event.id}")
+        return HttpResponse(status=200)
 
+    try:
+        dispatch_stripe_event(event)
         return HttpResponse(status=200)
     except Exception as e:
+        release_stripe_event(event)
         logger.exception(f"Error processing webhook: {str(e)}")
         return HttpResponse(status=500)
@@ -0,0 +1,28 @@
+"""
+Cached lookups for near-static billing configuration.
+"""
+
+from django.core.cache import cache
+
+from .models import BillingPlan
+
+PLAN_CACHE_TIMEOUT = 3600  # 1 hour
+
+
+def _plan_cache_key(key: str) -> str:
+    return f"billing_plan:{key}"
+
+
+def get_plan(key: str) -> BillingPlan:
+    """
+    Get a billing plan by key, served from the cache when possible.
+
+    Raises:
+        BillingPlan.DoesNotExist: If no plan exists with the given key
+    """
+    return cache.get_or_set(_plan_cache_key(key), lambda: BillingPlan.objects.get(key=key), PLAN_CACHE_TIMEOUT)
+
+
+def invalidate_plan(key: str) -> None:
+    """Drop a cached billing plan so the next lookup hits the database."""
+    cache.delete(_plan_cache_key(key))
@@ -46,6 +46,13 @@ class BillingPlan(models.Model):
         """Check if this plan includes Dependency Track access."""
         return self.key in ["business", "enterprise"]
 
+    @property
+    def is_unlimited(self) -> bool:
+        """Check if this plan has no product, project or component limits."""
+        return self.key == "enterprise" or (
+            self.max_products is None and self.max_projects is None and self.max_components is None
+        )
+
     @property
     def allows_unlimited_users(self) -> bool:
         """Check if this plan allows unlimited users."""
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_plan
+from .models import BillingPlan
+
+
+@receiver(post_save, sender=BillingPlan)
+@receiver(post_delete, sender=BillingPlan)
+def invalidate_cached_plan(sender, instance, **kwargs):
+    """Keep the billing plan cache in sync with plan edits made via the ORM or admin."""
+    if instance.key:
+        invalidate_plan(instance.key)
@@ -10,6 +10,28 @@ from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+# Stripe error type -> (log label, message template for the re-raised StripeError).
+# Templates may use {error} (the Stripe error text) and {user_message} (set on card errors).
+STRIPE_ERROR_MESSAGES = {
+    stripe.error.CardError: ("Card error", "Card error: {user_message}"),
+    stripe.error.RateLimitError: ("Rate limit error", "Too many requests made to Stripe API"),
+    stripe.error.InvalidRequestError: ("Invalid request error", "Invalid request: {error}"),
+    stripe.error.AuthenticationError: ("Authentication error", "Authentication with Stripe failed"),
+    stripe.error.APIConnectionError: ("API connection error", "Could not connect to Stripe API"),
+}
+DEFAULT_STRIPE_ERROR_MESSAGE = ("Stripe error", "Stripe error: {error}")
+
+
+def describe_stripe_error(error: stripe.error.StripeError) -> tuple[str, str]:
+    """Get the log label and user-facing message for a Stripe error."""
+    for error_class in type(error).__mro__:
+        if error_class in STRIPE_ERROR_MESSAGES:
+            log_label, template = STRIPE_ERROR_MESSAGES[error_class]
+            break
+    else:
+        log_label, template = DEFAULT_STRIPE_ERROR_MESSAGE
+    return log_label, template.format(error=str(error), user_message=getattr(error, "user_message", None))
+
 
 class StripeClient:
     """Wrapper for Stripe operations with proper error handling and caching."""
@@ -28,24 +50,10 @@ class StripeClient:
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
-            except stripe.error.CardError as e:
-                logger.error(f"Card error: {str(e)}")
-                raise StripeError(f"Card error: {e.user_message}")
-            except stripe.error.RateLimitError as e:
-                logger.error(f"Rate limit error: {str(e)}")
-                raise StripeError("Too many requests made to Stripe API")
-            except stripe.error.InvalidRequestError as e:
-                logger.error(f"Invalid request error: {str(e)}")
-                raise StripeError(f"Invalid request: {str(e)}")
-            except stripe.error.AuthenticationError as e:
-                logger.error(f"Authentication error: {str(e)}")
-                raise StripeError("Authentication with Stripe failed")
-            except stripe.error.APIConnectionError as e:
-                logger.error(f"API connection error: {str(e)}")
-                raise StripeError("Could not connect to Stripe API")
             except stripe.error.StripeError as e:
-                logger.error(f"Stripe error: {str(e)}")
-                raise StripeError(f"Stripe error: {str(e)}")
+                log_label, message = describe_stripe_error(e)
+                logger.error(f"{log_label}: {str(e)}")
+                raise StripeError(message)
             except Exception as e:
                 logger.exception(f"Unexpected error: {str(e)}")
                 raise StripeError(f"Unexpected error: {str(e)}")
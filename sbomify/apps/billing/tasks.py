@@ -0,0 +1,52 @@
+"""
+Dramatiq tasks for Stripe webhook processing.
+"""
+
+import json
+
+import dramatiq
+import stripe
+
+from sbomify.logging import getLogger
+
+from . import billing_processing
+
+logger = getLogger(__name__)
+
+
+@dramatiq.actor(
+    queue_name="billing_webhooks",
+    max_retries=3,
+    time_limit=60000,
+    on_failure="release_stripe_event_task",
+)
+def process_stripe_event_task(payload: str) -> None:
+    """
+    Process a Stripe webhook event outside of the webhook request.
+
+    Args:
+        payload: Raw webhook request body, whose signature the view has already verified
+    """
+    event = stripe.Event.construct_from(json.loads(payload), stripe.api_key)
+    logger.info(f"[TASK_process_stripe_event] Processing {event.type} event {event.id}")
+    billing_processing.dispatch_stripe_event(event)
+
+
+@dramatiq.actor(queue_name="billing_webhooks")
+def release_stripe_event_task(message_data: dict, exception_data: dict) -> None:
+    """
+    Release the claim on a Stripe event whose processing failed on its last retry.
+
+    The webhook view claims the event before queueing it, so without this Stripe's redelivery
+    of the event would be skipped as a duplicate and the event lost.
+
+    Args:
+        message_data: The failed process_stripe_event_task message
+        exception_data: Type and message of the exception raised by the last attempt
+    """
+    event = stripe.Event.construct_from(json.loads(message_data["args"][0]), stripe.api_key)
+    logger.error(
+        f"[TASK_process_stripe_event] Giving up on {event.type} event {event.id}: "
+        f"{exception_data.get('type')}: {exception_data.get('message')}"
+    )
+    billing_processing.release_stripe_event(event)
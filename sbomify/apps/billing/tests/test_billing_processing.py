@@ -8,7 +8,9 @@ import stripe
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.conf import settings
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.http import HttpResponseForbidden
 
 from sbomify.apps.billing import billing_processing
@@ -147,6 +149,71 @@ class TestBillingProcessing:
         assert self.team.billing_plan_limits["is_trial"] is False
         mock_email.notify_trial_expired.assert_called_once()
 
+    @patch("sbomify.apps.billing.billing_processing.email_notifications")
+    def test_handle_subscription_updated_trial_emails_sent_after_commit(self, mock_email):
+        """Test that trial notifications are sent once the team row lock is released."""
+        self.subscription.status = "trialing"
+        self.subscription.trial_end = int((timezone.now() + datetime.timedelta(days=1)).timestamp())
+
+        # The test's own transaction is the outermost one, so any savepoint means the handler's block is open
+        open_savepoints = []
+        mock_email.notify_trial_ending.side_effect = lambda *args: open_savepoints.append(
+            len(connection.savepoint_ids)
+        )
+
+        billing_processing.handle_subscription_updated(self.subscription)
+
+        assert open_savepoints == [0]
+
+    @patch("sbomify.apps.billing.billing_processing.email_notifications")
+    def test_handle_subscription_updated_found_by_customer(self, mock_email):
+        """Test that a new subscription for a known customer is matched to the team and recorded."""
+        self.subscription.id = "sub_new456"
+
+        billing_processing.handle_subscription_updated(self.subscription)
+
+        self.team.refresh_from_db()
+        assert self.team.billing_plan_limits["stripe_subscription_id"] == "sub_new456"
+        self.stripe_client.get_customer.assert_not_called()
+
+    @patch("sbomify.apps.billing.billing_processing.email_notifications")
+    def test_handle_subscription_updated_prefers_subscription_match(self, mock_email):
+        """Test that a team matched by subscription ID wins over another team matched by customer ID."""
+        other_team = Team.objects.create(
+            name="Other Team",
+            billing_plan_limits={"stripe_customer_id": self.subscription.customer, "stripe_subscription_id": "sub_old"},
+        )
+
+        billing_processing.handle_subscription_updated(self.subscription)
+
+        other_team.refresh_from_db()
+        assert "subscription_status" not in other_team.billing_plan_limits
+        self.team.refresh_from_db()
+        assert self.team.billing_plan_limits["subscription_status"] == "active"
+
+    @patch("sbomify.apps.billing.billing_processing.email_notifications")
+    def test_handle_subscription_updated_rejects_ambiguous_teams(self, mock_email):
+        """Test that teams sharing a subscription ID are reported rather than one being updated."""
+        other_team = Team.objects.create(name="Other Team", billing_plan_limits=dict(self.team.billing_plan_limits))
+        self.subscription.status = "past_due"
+
+        with pytest.raises(StripeError):
+            billing_processing.handle_subscription_updated(self.subscription)
+
+        for team in (self.team, other_team):
+            team.refresh_from_db()
+            assert team.billing_plan_limits.get("subscription_status") != "past_due"
+        mock_email.notify_payment_past_due.assert_not_called()
+
+    @patch("sbomify.apps.billing.billing_processing.email_notifications")
+    def test_handle_subscription_updated_reads_team_once(self, mock_email):
+        """Test that the team is looked up and locked with a single query."""
+        with CaptureQueriesContext(connection) as queries:
+            billing_processing.handle_subscription_updated(self.subscription)
+
+        team_selects = [q["sql"] for q in queries if q["sql"].startswith("SELECT") and 'FROM "teams_teams"' in q["sql"]]
+        assert len(team_selects) == 1
+
     @patch("sbomify.apps.billing.billing_processing.email_notifications")
     def test_handle_checkout_completed_trial(self, mock_email):
         """Test handling checkout completion with trial period."""
@@ -165,6 +232,17 @@ class TestBillingProcessing:
         assert self.team.billing_plan_limits["trial_end"] == self.subscription.trial_end
         mock_email.notify_trial_ending.assert_called_once()
 
+    def test_handle_checkout_completed_expanded_subscription(self):
+        """Test that an expanded subscription on the session is used without another Stripe call."""
+        self.session.subscription = self.subscription
+
+        billing_processing.handle_checkout_completed(self.session)
+
+        self.team.refresh_from_db()
+        assert self.team.billing_plan_limits["stripe_subscription_id"] == self.subscription.id
+        assert self.team.billing_plan_limits["subscription_status"] == "active"
+        self.stripe_client.get_subscription.assert_not_called()
+
     @patch("sbomify.apps.billing.billing_processing.email_notifications")
     def test_handle_payment_succeeded(self, mock_email):
         """Test handling successful payment."""
@@ -341,6 +419,18 @@ def test_can_downgrade_to_plan_within_limits(team_with_business_plan, business_p
     assert message == ""
 
 
+def test_can_downgrade_to_plan_counts_in_one_query(team_with_business_plan, business_plan, django_assert_num_queries):
+    """Test downgrade check counts all resource types with a single query."""
+    Product.objects.create(team=team_with_business_plan, name="Product")
+    for i in range(business_plan.max_components + 1):
+        Component.objects.create(team=team_with_business_plan, name=f"Component {i}")
+
+    with django_assert_num_queries(1):
+        can_downgrade, message = billing_processing.can_downgrade_to_plan(team_with_business_plan, business_plan)
+    assert can_downgrade is False
+    assert message == f"Current usage exceeds plan limits: components (101 > {business_plan.max_components})"
+
+
 def test_can_downgrade_to_plan_exceeds_limits(team_with_business_plan, business_plan):
     """Test downgrade check when usage exceeds plan limits."""
     # Create test data exceeding limits
@@ -0,0 +1,35 @@
+import pytest
+
+from sbomify.apps.billing.cache import get_plan
+from sbomify.apps.billing.models import BillingPlan
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_plan_is_served_from_cache(django_assert_num_queries):
+    BillingPlan.objects.create(key="cached", name="Cached", max_products=3)
+
+    with django_assert_num_queries(1):
+        assert get_plan("cached").max_products == 3
+        assert get_plan("cached").max_products == 3
+
+
+def test_get_plan_missing_is_not_cached():
+    with pytest.raises(BillingPlan.DoesNotExist):
+        get_plan("missing")
+
+    BillingPlan.objects.create(key="missing", name="Missing")
+    assert get_plan("missing").name == "Missing"
+
+
+def test_plan_save_invalidates_cache():
+    plan = BillingPlan.objects.create(key="cached", name="Cached", max_products=3)
+    assert get_plan("cached").max_products == 3
+
+    plan.max_products = 5
+    plan.save()
+    assert get_plan("cached").max_products == 5
+
+    plan.delete()
+    with pytest.raises(BillingPlan.DoesNotExist):
+        get_plan("cached")
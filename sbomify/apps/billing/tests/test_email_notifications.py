@@ -43,11 +43,11 @@ def test_notify_trial_ending(team):
     team, member = team
     days_remaining = 3
 
-    with patch("sbomify.apps.billing.email_notifications.send_billing_email") as mock_send:
-        email_notifications.notify_trial_ending(team, member, days_remaining)
+    with patch("sbomify.apps.billing.email_notifications.send_billing_emails") as mock_send:
+        email_notifications.notify_trial_ending(team, [member], days_remaining)
         mock_send.assert_called_once_with(
             team,
-            member,
+            [member],
             "Trial Period Ending",
             "trial_ending",
             {"days_remaining": days_remaining},
@@ -59,11 +59,11 @@ def test_notify_payment_failed(team):
     team, member = team
     invoice_id = "inv_123"
 
-    with patch("sbomify.apps.billing.email_notifications.send_billing_email") as mock_send:
-        email_notifications.notify_payment_failed(team, member, invoice_id)
+    with patch("sbomify.apps.billing.email_notifications.send_billing_emails") as mock_send:
+        email_notifications.notify_payment_failed(team, [member], invoice_id)
         mock_send.assert_called_once_with(
             team,
-            member,
+            [member],
             "Payment Failed",
             "payment_failed",
             {"invoice_id": invoice_id},
@@ -74,11 +74,11 @@ def test_notify_payment_failed_no_invoice(team):
     """Test payment failed notification without invoice ID."""
     team, member = team
 
-    with patch("sbomify.apps.billing.email_notifications.send_billing_email") as mock_send:
-        email_notifications.notify_payment_failed(team, member, None)
+    with patch("sbomify.apps.billing.email_notifications.send_billing_emails") as mock_send:
+        email_notifications.notify_payment_failed(team, [member], None)
         mock_send.assert_called_once_with(
             team,
-            member,
+            [member],
             "Payment Failed",
             "payment_failed",
             {"invoice_id": None},
@@ -89,11 +89,11 @@ def test_notify_payment_past_due(team):
     """Test payment past due notification."""
     team, member = team
 
-    with patch("sbomify.apps.billing.email_notifications.send_billing_email") as mock_send:
-        email_notifications.notify_payment_past_due(team, member)
+    with patch("sbomify.apps.billing.email_notifications.send_billing_emails") as mock_send:
+        email_notifications.notify_payment_past_due(team, [member])
         mock_send.assert_called_once_with(
             team,
-            member,
+            [member],
             "Payment Past Due - Action Required",
             "payment_past_due",
             {},
@@ -104,11 +104,11 @@ def test_notify_subscription_cancelled(team):
     """Test subscription cancelled notification."""
     team, member = team
 
-    with patch("sbomify.apps.billing.email_notifications.send_billing_email") as mock_send:
-        email_notifications.notify_subscription_cancelled(team, member)
+    with patch("sbomify.apps.billing.email_notifications.send_billing_emails") as mock_send:
+        email_notifications.notify_subscription_cancelled(team, [member])
         mock_send.assert_called_once_with(
             team,
-            member,
+            [member],
             "Subscription Cancelled",
             "subscription_cancelled",
             {},
@@ -119,18 +119,18 @@ def test_notify_payment_succeeded(team):
     """Test payment succeeded notification."""
     team, member = team
 
-    with patch("sbomify.apps.billing.email_notifications.send_billing_email") as mock_send:
-        email_notifications.notify_payment_succeeded(team, member)
+    with patch("sbomify.apps.billing.email_notifications.send_billing_emails") as mock_send:
+        email_notifications.notify_payment_succeeded(team, [member])
         mock_send.assert_called_once_with(
             team,
-            member,
+            [member],
             "Payment Successful",
             "payment_succeeded",
             {},
         )
 
 
-def test_send_billing_email(team):
+def test_send_billing_emails(team):
     """Test sending billing email with template."""
     team, member = team
     subject = "Test Subject"
@@ -139,24 +139,23 @@ def test_send_billing_email(team):
 
     with patch("sbomify.apps.billing.email_notifications.render_to_string") as mock_render:
         mock_render.side_effect = ["html_content", "text_content"]
-        with patch("sbomify.apps.billing.email_notifications.send_mail") as mock_send:
-            email_notifications.send_billing_email(team, member, subject, template, context)
-            mock_send.assert_called_once_with(
-                subject,
-                "text_content",
-                None,  # DEFAULT_FROM_EMAIL
-                [member.user.email],
-                html_message="html_content",
-                fail_silently=True,
-            )
-            assert mock_render.call_count == 2
-            mock_render.assert_has_calls([
-                mock.call(f"billing/emails/{template}.html.j2", context),
-                mock.call(f"billing/emails/{template}.txt", context),
-            ])
-
-
-def test_send_billing_email_template_error(team):
+        email_notifications.send_billing_emails(team, [member], subject, template, context)
+        assert mock_render.call_count == 2
+        mock_render.assert_has_calls([
+            mock.call(f"billing/emails/{template}.html.j2", context),
+            mock.call(f"billing/emails/{template}.txt", context),
+        ])
+
+    assert len(mail.outbox) == 1
+    message = mail.outbox[0]
+    assert message.subject == subject
+    assert message.body == "text_content"
+    assert message.from_email == settings.DEFAULT_FROM_EMAIL
+    assert message.to == [member.user.email]
+    assert message.alternatives[0][0] == "html_content"
+
+
+def test_send_billing_emails_template_error(team):
     """Test sending billing email with template error."""
     team, member = team
     subject = "Test Subject"
@@ -165,11 +164,11 @@ def test_send_billing_email_template_error(team):
 
     with patch("sbomify.apps.billing.email_notifications.render_to_string", side_effect=Exception("Template error")):
         with patch("sbomify.apps.billing.email_notifications.logger") as mock_logger:
-            email_notifications.send_billing_email(team, member, subject, template, context)
+            email_notifications.send_billing_emails(team, [member], subject, template, context)
             mock_logger.error.assert_called_once()
 
 
-def test_send_billing_email_send_error(team):
+def test_send_billing_emails_send_error(team):
     """Test sending billing email with send error."""
     team, member = team
     subject = "Test Subject"
@@ -178,13 +177,14 @@ def test_send_billing_email_send_error(team):
 
     with patch("sbomify.apps.billing.email_notifications.render_to_string") as mock_render:
         mock_render.side_effect = ["html_content", "text_content"]
-        with patch("sbomify.apps.billing.email_notifications.send_mail", side_effect=Exception("Send error")):
+        with patch("sbomify.apps.billing.email_notifications.get_connection") as mock_connection:
+            mock_connection.return_value.send_messages.side_effect = Exception("Send error")
             with patch("sbomify.apps.billing.email_notifications.logger") as mock_logger:
-                email_notifications.send_billing_email(team, member, subject, template, context)
+                email_notifications.send_billing_emails(team, [member], subject, template, context)
                 mock_logger.error.assert_called_once()
 
 
-def test_send_billing_email_invalid_team(team):
+def test_send_billing_emails_invalid_team(team):
     """Test sending billing email with invalid team."""
     team, member = team
     subject = "Test Subject"
@@ -195,20 +195,35 @@ def test_send_billing_email_invalid_team(team):
     team = None
 
     with patch("sbomify.apps.billing.email_notifications.logger") as mock_logger:
-        email_notifications.send_billing_email(team, member, subject, template, context)
+        email_notifications.send_billing_emails(team, [member], subject, template, context)
         mock_logger.error.assert_called_once()
 
 
-def test_send_billing_email_invalid_member(team):
+def test_send_billing_emails_invalid_member(team):
     """Test sending billing email with invalid member."""
     team, member = team
     subject = "Test Subject"
     template = "test_template"
     context = {"test_key": "test_value"}
 
-    # Set member to None to simulate invalid member
-    member = None
+    # Pass None as the only member to simulate an invalid member
+    with patch("sbomify.apps.billing.email_notifications.render_to_string") as mock_render:
+        email_notifications.send_billing_emails(team, [None], subject, template, context)
+        mock_render.assert_not_called()
 
-    with patch("sbomify.apps.billing.email_notifications.logger") as mock_logger:
-        email_notifications.send_billing_email(team, member, subject, template, context)
-        mock_logger.error.assert_called_once()
\ No newline at end of file
+    assert mail.outbox == []
+
+
+def test_send_billing_emails_renders_once_for_all_members(team):
+    """Test bulk billing email renders the template once and sends one message per member."""
+    team, member = team
+    other_user = User.objects.create_user(username="otheruser", email="other@example.com", password="testpass123")
+    other_member = Member.objects.create(team=team, user=other_user, role="owner")
+
+    with patch("sbomify.apps.billing.email_notifications.render_to_string") as mock_render:
+        mock_render.side_effect = ["html_content", "text_content"]
+        email_notifications.send_billing_emails(team, [member, other_member], "Test Subject", "test_template", {})
+
+    assert mock_render.call_count == 2
+    assert [message.to for message in mail.outbox] == [["test@example.com"], ["other@example.com"]]
+    assert mail.outbox[0].alternatives[0][0] == "html_content"
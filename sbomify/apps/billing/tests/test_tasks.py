@@ -0,0 +1,51 @@
+"""Tests for billing Dramatiq tasks."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from sbomify.apps.billing import billing_processing
+from sbomify.apps.billing.tasks import process_stripe_event_task, release_stripe_event_task
+
+
+def test_process_stripe_event_task_dispatches_to_handler():
+    """Test that a queued webhook payload is rebuilt into a Stripe event and handled."""
+    payload = json.dumps(
+        {
+            "id": "evt_task_test",
+            "object": "event",
+            "type": "invoice.payment_failed",
+            "data": {"object": {"id": "in_123", "object": "invoice", "subscription": "sub_test123"}},
+        }
+    )
+
+    mock_handler = MagicMock()
+    with patch.dict(billing_processing.STRIPE_EVENT_HANDLERS, {"invoice.payment_failed": mock_handler}):
+        process_stripe_event_task.fn(payload)
+
+    mock_handler.assert_called_once()
+    invoice = mock_handler.call_args.args[0]
+    assert invoice.id == "in_123"
+    assert invoice.subscription == "sub_test123"
+
+
+def test_process_stripe_event_task_ignores_unhandled_types():
+    """Test that unhandled event types are acknowledged without calling any handler."""
+    payload = json.dumps({"id": "evt_other", "object": "event", "type": "customer.created", "data": {"object": {}}})
+
+    mock_handler = MagicMock()
+    with patch.dict(billing_processing.STRIPE_EVENT_HANDLERS, {"checkout.session.completed": mock_handler}):
+        process_stripe_event_task.fn(payload)
+
+    mock_handler.assert_not_called()
+
+
+def test_failed_stripe_event_is_released_for_redelivery():
+    """Test that an event whose processing failed for good is unclaimed so Stripe's redelivery is handled."""
+    payload = json.dumps({"id": "evt_failed_task", "object": "event", "type": "invoice.payment_failed", "data": {}})
+    event = MagicMock(id="evt_failed_task")
+    assert billing_processing.claim_stripe_event(event)
+
+    assert process_stripe_event_task.options["on_failure"] == release_stripe_event_task.actor_name
+    release_stripe_event_task.fn({"args": [payload]}, {"type": "StripeError", "message": "Test error"})
+
+    assert billing_processing.claim_stripe_event(event)
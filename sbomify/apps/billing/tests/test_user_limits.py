@@ -217,7 +217,7 @@ class NTIAFeatureGatingTestCase(TestCase):
         self.assertTrue(self.business_plan.has_dependency_track_access)
         self.assertTrue(self.enterprise_plan.has_dependency_track_access)
 
-    @patch("sbomify.tasks.check_sbom_ntia_compliance.send_with_options")
+    @patch("sbomify.tasks.check_sbom_ntia_compliance.send")
     def test_ntia_compliance_not_triggered_for_community(self, mock_task):
         """Test that NTIA compliance is not triggered for community plans."""
         team = Team.objects.create(name="Community Team", billing_plan="community")
@@ -225,16 +225,17 @@ class NTIAFeatureGatingTestCase(TestCase):
         component = Component.objects.create(name="Test Component", team=team)
 
         # Create SBOM - this should not trigger NTIA compliance check
-        _sbom = SBOM.objects.create(
-            name="test-sbom",
-            component=component,
-            format="spdx"
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            _sbom = SBOM.objects.create(
+                name="test-sbom",
+                component=component,
+                format="spdx"
+            )
 
         # NTIA compliance task should not be called
         mock_task.assert_not_called()
 
-    @patch("sbomify.tasks.check_sbom_ntia_compliance.send_with_options")
+    @patch("sbomify.tasks.check_sbom_ntia_compliance.send")
     def test_ntia_compliance_triggered_for_business(self, mock_task):
         """Test that NTIA compliance is triggered for business plans."""
         team = Team.objects.create(name="Business Team", billing_plan="business")
@@ -242,16 +243,17 @@ class NTIAFeatureGatingTestCase(TestCase):
         component = Component.objects.create(name="Test Component", team=team)
 
         # Create SBOM - this should trigger NTIA compliance check
-        sbom = SBOM.objects.create(
-            name="test-sbom",
-            component=component,
-            format="spdx"
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            sbom = SBOM.objects.create(
+                name="test-sbom",
+                component=component,
+                format="spdx"
+            )
 
         # NTIA compliance task should be called
-        mock_task.assert_called_once_with(args=[sbom.id], delay=60000)
+        mock_task.assert_called_once_with(sbom.id)
 
-    @patch("sbomify.tasks.check_sbom_ntia_compliance.send_with_options")
+    @patch("sbomify.tasks.check_sbom_ntia_compliance.send")
     def test_ntia_compliance_triggered_for_enterprise(self, mock_task):
         """Test that NTIA compliance is triggered for enterprise plans."""
         team = Team.objects.create(name="Enterprise Team", billing_plan="enterprise")
@@ -259,16 +261,17 @@ class NTIAFeatureGatingTestCase(TestCase):
         component = Component.objects.create(name="Test Component", team=team)
 
         # Create SBOM - this should trigger NTIA compliance check
-        sbom = SBOM.objects.create(
-            name="test-sbom",
-            component=component,
-            format="spdx"
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            sbom = SBOM.objects.create(
+                name="test-sbom",
+                component=component,
+                format="spdx"
+            )
 
         # NTIA compliance task should be called
-        mock_task.assert_called_once_with(args=[sbom.id], delay=60000)
+        mock_task.assert_called_once_with(sbom.id)
 
-    @patch("sbomify.tasks.check_sbom_ntia_compliance.send_with_options")
+    @patch("sbomify.tasks.check_sbom_ntia_compliance.send")
     def test_ntia_compliance_not_triggered_for_no_plan(self, mock_task):
         """Test that NTIA compliance is not triggered when team has no billing plan."""
         team = Team.objects.create(name="No Plan Team")  # No billing_plan set
@@ -276,16 +279,17 @@ class NTIAFeatureGatingTestCase(TestCase):
         component = Component.objects.create(name="Test Component", team=team)
 
         # Create SBOM - this should not trigger NTIA compliance check
-        _sbom = SBOM.objects.create(
-            name="test-sbom",
-            component=component,
-            format="spdx"
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            _sbom = SBOM.objects.create(
+                name="test-sbom",
+                component=component,
+                format="spdx"
+            )
 
         # NTIA compliance task should not be called
         mock_task.assert_not_called()
 
-    @patch("sbomify.tasks.check_sbom_ntia_compliance.send_with_options")
+    @patch("sbomify.tasks.check_sbom_ntia_compliance.send")
     def test_ntia_compliance_not_triggered_for_invalid_plan(self, mock_task):
         """Test that NTIA compliance is not triggered for invalid billing plans."""
         team = Team.objects.create(name="Invalid Plan Team", billing_plan="invalid_plan")
@@ -293,16 +297,17 @@ class NTIAFeatureGatingTestCase(TestCase):
         component = Component.objects.create(name="Test Component", team=team)
 
         # Create SBOM - this should not trigger NTIA compliance check
-        _sbom = SBOM.objects.create(
-            name="test-sbom",
-            component=component,
-            format="spdx"
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            _sbom = SBOM.objects.create(
+                name="test-sbom",
+                component=component,
+                format="spdx"
+            )
 
         # NTIA compliance task should not be called
         mock_task.assert_not_called()
 
-    @patch("sbomify.tasks.scan_sbom_for_vulnerabilities_unified.send_with_options")
+    @patch("sbomify.tasks.scan_sbom_for_vulnerabilities_unified.send")
     def test_vulnerability_scan_triggered_for_community(self, mock_task):
         """Test that vulnerability scanning is triggered for community plans (using OSV)."""
         team = Team.objects.create(name="Community Team", billing_plan="community")
@@ -310,16 +315,17 @@ class NTIAFeatureGatingTestCase(TestCase):
         component = Component.objects.create(name="Test Component", team=team)
 
         # Create SBOM - this should trigger vulnerability scan with OSV
-        sbom = SBOM.objects.create(
-            name="test-sbom",
-            component=component,
-            format="spdx"
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            sbom = SBOM.objects.create(
+                name="test-sbom",
+                component=component,
+                format="spdx"
+            )
 
         # Vulnerability scan task should be called
-        mock_task.assert_called_once_with(args=[sbom.id], delay=90000)
+        mock_task.assert_called_once_with(sbom.id)
 
-    @patch("sbomify.tasks.scan_sbom_for_vulnerabilities_unified.send_with_options")
+    @patch("sbomify.tasks.scan_sbom_for_vulnerabilities_unified.send")
     def test_vulnerability_scan_triggered_for_business(self, mock_task):
         """Test that vulnerability scanning is triggered for business plans."""
         team = Team.objects.create(name="Business Team", billing_plan="business")
@@ -327,16 +333,17 @@ class NTIAFeatureGatingTestCase(TestCase):
         component = Component.objects.create(name="Test Component", team=team)
 
         # Create SBOM - this should trigger vulnerability scan
-        sbom = SBOM.objects.create(
-            name="test-sbom",
-            component=component,
-            format="spdx"
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            sbom = SBOM.objects.create(
+                name="test-sbom",
+                component=component,
+                format="spdx"
+            )
 
         # Vulnerability scan task should be called
-        mock_task.assert_called_once_with(args=[sbom.id], delay=90000)
+        mock_task.assert_called_once_with(sbom.id)
 
-    @patch("sbomify.tasks.scan_sbom_for_vulnerabilities_unified.send_with_options")
+    @patch("sbomify.tasks.scan_sbom_for_vulnerabilities_unified.send")
     def test_vulnerability_scan_triggered_for_enterprise(self, mock_task):
         """Test that vulnerability scanning is triggered for enterprise plans."""
         team = Team.objects.create(name="Enterprise Team", billing_plan="enterprise")
@@ -344,16 +351,17 @@ class NTIAFeatureGatingTestCase(TestCase):
         component = Component.objects.create(name="Test Component", team=team)
 
         # Create SBOM - this should trigger vulnerability scan
-        sbom = SBOM.objects.create(
-            name="test-sbom",
-            component=component,
-            format="spdx"
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            sbom = SBOM.objects.create(
+                name="test-sbom",
+                component=component,
+                format="spdx"
+            )
 
         # Vulnerability scan task should be called
-        mock_task.assert_called_once_with(args=[sbom.id], delay=90000)
+        mock_task.assert_called_once_with(sbom.id)
 
-    @patch("sbomify.tasks.scan_sbom_for_vulnerabilities_unified.send_with_options")
+    @patch("sbomify.tasks.scan_sbom_for_vulnerabilities_unified.send")
     def test_vulnerability_scan_triggered_for_no_plan(self, mock_task):
         """Test that vulnerability scanning is triggered when team has no billing plan (using OSV)."""
         team = Team.objects.create(name="No Plan Team")  # No billing_plan set
@@ -361,16 +369,17 @@ class NTIAFeatureGatingTestCase(TestCase):
         component = Component.objects.create(name="Test Component", team=team)
 
         # Create SBOM - this should trigger vulnerability scan with OSV
-        sbom = SBOM.objects.create(
-            name="test-sbom",
-            component=component,
-            format="spdx"
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            sbom = SBOM.objects.create(
+                name="test-sbom",
+                component=component,
+                format="spdx"
+            )
 
         # Vulnerability scan task should be called
-        mock_task.assert_called_once_with(args=[sbom.id], delay=90000)
+        mock_task.assert_called_once_with(sbom.id)
 
-    @patch("sbomify.tasks.scan_sbom_for_vulnerabilities_unified.send_with_options")
+    @patch("sbomify.tasks.scan_sbom_for_vulnerabilities_unified.send")
     def test_vulnerability_scan_triggered_for_invalid_plan(self, mock_task):
         """Test that vulnerability scanning is triggered for invalid billing plans (using OSV)."""
         team = Team.objects.create(name="Invalid Plan Team", billing_plan="invalid_plan")
@@ -378,14 +387,15 @@ class NTIAFeatureGatingTestCase(TestCase):
         component = Component.objects.create(name="Test Component", team=team)
 
         # Create SBOM - this should trigger vulnerability scan with OSV
-        sbom = SBOM.objects.create(
-            name="test-sbom",
-            component=component,
-            format="spdx"
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            sbom = SBOM.objects.create(
+                name="test-sbom",
+                component=component,
+                format="spdx"
+            )
 
         # Vulnerability scan task should be called
-        mock_task.assert_called_once_with(args=[sbom.id], delay=90000)
+        mock_task.assert_called_once_with(sbom.id)
 
 
 class InvitationUserLimitsTestCase(TestCase):
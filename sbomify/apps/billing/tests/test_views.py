@@ -165,12 +165,13 @@ def test_stripe_webhook_checkout_completed(factory, team_with_business_plan):
     request.headers = {"Stripe-Signature": "test_sig"}
 
     mock_event = MagicMock()
+    mock_event.id = "evt_test"
     mock_event.type = event_data["type"]
     mock_event.data.object = event_data["data"]["object"]
 
     with patch("sbomify.apps.billing.billing_processing.verify_stripe_webhook") as mock_verify:
         mock_verify.return_value = mock_event
-        with patch("sbomify.apps.billing.billing_processing.handle_checkout_completed"):
+        with patch.dict(billing_processing.STRIPE_EVENT_HANDLERS, {mock_event.type: MagicMock()}):
             response = billing_processing.stripe_webhook(request)
             assert response.status_code == 200
 
@@ -198,12 +199,13 @@ def test_stripe_webhook_subscription_updated(factory, team_with_business_plan):
     request.headers = {"Stripe-Signature": "test_sig"}
 
     mock_event = MagicMock()
+    mock_event.id = "evt_test"
     mock_event.type = event_data["type"]
     mock_event.data.object = event_data["data"]["object"]
 
     with patch("sbomify.apps.billing.billing_processing.verify_stripe_webhook") as mock_verify:
         mock_verify.return_value = mock_event
-        with patch("sbomify.apps.billing.billing_processing.handle_subscription_updated"):
+        with patch.dict(billing_processing.STRIPE_EVENT_HANDLERS, {mock_event.type: MagicMock()}):
             response = billing_processing.stripe_webhook(request)
             assert response.status_code == 200
 
@@ -230,16 +232,61 @@ def test_stripe_webhook_payment_failed(factory, team_with_business_plan):
     request.headers = {"Stripe-Signature": "test_sig"}
 
     mock_event = MagicMock()
+    mock_event.id = "evt_test"
     mock_event.type = event_data["type"]
     mock_event.data.object = event_data["data"]["object"]
 
     with patch("sbomify.apps.billing.billing_processing.verify_stripe_webhook") as mock_verify:
         mock_verify.return_value = mock_event
-        with patch("sbomify.apps.billing.billing_processing.handle_payment_failed"):
+        with patch.dict(billing_processing.STRIPE_EVENT_HANDLERS, {mock_event.type: MagicMock()}):
             response = billing_processing.stripe_webhook(request)
             assert response.status_code == 200
 
 
+@pytest.mark.django_db
+def test_stripe_webhook_duplicate_event_skipped(factory):
+    """Test that a redelivered event is acknowledged without being processed again."""
+    request = factory.post(
+        reverse("billing:webhook"),
+        data=json.dumps({"type": "invoice.payment_failed"}),
+        content_type="application/json",
+    )
+    request.headers = {"Stripe-Signature": "test_sig"}
+
+    mock_event = MagicMock()
+    mock_event.id = "evt_test"
+    mock_event.type = "invoice.payment_failed"
+
+    mock_handler = MagicMock()
+    with patch("sbomify.apps.billing.billing_processing.verify_stripe_webhook", return_value=mock_event):
+        with patch.dict(billing_processing.STRIPE_EVENT_HANDLERS, {mock_event.type: mock_handler}):
+            assert billing_processing.stripe_webhook(request).status_code == 200
+            assert billing_processing.stripe_webhook(request).status_code == 200
+            mock_handler.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_stripe_webhook_failed_event_can_be_retried(factory):
+    """Test that an event whose processing failed is processed again on retry."""
+    request = factory.post(
+        reverse("billing:webhook"),
+        data=json.dumps({"type": "invoice.payment_failed"}),
+        content_type="application/json",
+    )
+    request.headers = {"Stripe-Signature": "test_sig"}
+
+    mock_event = MagicMock()
+    mock_event.id = "evt_test"
+    mock_event.type = "invoice.payment_failed"
+
+    mock_handler = MagicMock(side_effect=[Exception("Test error"), None])
+    with patch("sbomify.apps.billing.billing_processing.verify_stripe_webhook", return_value=mock_event):
+        with patch.dict(billing_processing.STRIPE_EVENT_HANDLERS, {mock_event.type: mock_handler}):
+            assert billing_processing.stripe_webhook(request).status_code == 500
+            assert billing_processing.stripe_webhook(request).status_code == 200
+            assert mock_handler.call_count == 2
+
+
 @pytest.mark.django_db
 def test_stripe_webhook_error_handling(factory):
     """Test webhook error handling."""
@@ -251,12 +298,14 @@ def test_stripe_webhook_error_handling(factory):
     request.headers = {"Stripe-Signature": "test_sig"}
 
     mock_event = MagicMock()
+    mock_event.id = "evt_test"
     mock_event.type = "checkout.session.completed"
     mock_event.data.object = {}
 
     with patch("sbomify.apps.billing.billing_processing.verify_stripe_webhook") as mock_verify:
         mock_verify.return_value = mock_event
-        with patch("sbomify.apps.billing.billing_processing.handle_checkout_completed", side_effect=Exception("Test error")):
+        failing_handler = MagicMock(side_effect=Exception("Test error"))
+        with patch.dict(billing_processing.STRIPE_EVENT_HANDLERS, {mock_event.type: failing_handler}):
             response = billing_processing.stripe_webhook(request)
             assert response.status_code == 500
 
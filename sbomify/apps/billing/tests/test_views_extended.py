@@ -412,20 +412,22 @@ class TestWebhookViewIntegration:
     def test_stripe_webhook_view_success(self, mock_stripe_client):
         """Test successful webhook processing through view."""
         mock_event = MagicMock()
+        mock_event.id = "evt_test"
         mock_event.type = "checkout.session.completed"
         mock_event.data.object = {"id": "cs_123", "payment_status": "paid"}
         mock_stripe_client.construct_webhook_event.return_value = mock_event
 
-        with patch("sbomify.apps.billing.billing_processing.handle_checkout_completed") as mock_handler:
+        payload = json.dumps({"type": "checkout.session.completed"})
+        with patch("sbomify.apps.billing.tasks.process_stripe_event_task") as mock_task:
             response = self.client.post(
                 reverse("billing:webhook"),
-                data=json.dumps({"type": "checkout.session.completed"}),
+                data=payload,
                 content_type="application/json",
                 HTTP_STRIPE_SIGNATURE="test_signature",
             )
 
             assert response.status_code == 200
-            mock_handler.assert_called_once_with(mock_event.data.object)
+            mock_task.send.assert_called_once_with(payload)
 
     @patch("sbomify.apps.billing.views.stripe_client")
     def test_stripe_webhook_view_missing_signature(self, mock_stripe_client):
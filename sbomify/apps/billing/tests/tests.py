@@ -1,7 +1,9 @@
 """Generic billing functionality tests."""
 import pytest
 from django.contrib.auth.base_user import AbstractBaseUser
+from django.db import connection
 from django.http import HttpRequest, HttpResponse
+from django.test.utils import CaptureQueriesContext
 
 from sbomify.apps.billing.billing_processing import can_downgrade_to_plan, check_billing_limits
 from sbomify.apps.billing.models import BillingPlan
@@ -28,6 +30,17 @@ def test_billing_plan_str_representation(business_plan: BillingPlan):
     assert str(business_plan) == "Business (business)"
 
 
+@pytest.mark.django_db
+def test_billing_plan_is_unlimited(
+    community_plan: BillingPlan, business_plan: BillingPlan, enterprise_plan: BillingPlan
+):
+    """Test that only plans without resource limits are flagged as unlimited."""
+    assert community_plan.is_unlimited is False
+    assert business_plan.is_unlimited is False
+    assert enterprise_plan.is_unlimited is True
+    assert BillingPlan(key="custom").is_unlimited is True
+
+
 @pytest.mark.django_db
 def test_can_downgrade_to_enterprise_plan(
     team_with_business_plan: Team, enterprise_plan: BillingPlan
@@ -162,3 +175,26 @@ def test_project_creation_no_plan(team_with_business_plan: Team):
     response = dummy_view(request)
     assert response.status_code == 403
     assert "No active billing plan" in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_component_creation_enterprise_skips_count(
+    team_with_business_plan: Team, enterprise_plan: BillingPlan
+):
+    """Test that unlimited plans are let through without counting resources."""
+    team_with_business_plan.billing_plan = enterprise_plan.key
+    team_with_business_plan.save()
+
+    request = HttpRequest()
+    request.method = "POST"
+    request.session = {"current_team": {"key": team_with_business_plan.key}}
+
+    @check_billing_limits("component")
+    def dummy_view(request):
+        return HttpResponse("Success", status=200)
+
+    dummy_view(request)  # warm the plan cache
+    with CaptureQueriesContext(connection) as queries:
+        response = dummy_view(request)
+    assert response.status_code == 200
+    assert not [q for q in queries.captured_queries if Component._meta.db_table in q["sql"]]
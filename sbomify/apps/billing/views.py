@@ -540,6 +540,7 @@ def checkout_cancel(request):
 @require_http_methods(["POST"])
 def stripe_webhook(request):
     """Handle Stripe webhook events."""
+    event = None
     try:
         # Get the webhook signature
         signature = request.headers.get("Stripe-Signature")
@@ -550,30 +551,23 @@ def stripe_webhook(request):
         # Construct and verify the event
         event = stripe_client.construct_webhook_event(request.body, signature, settings.STRIPE_WEBHOOK_SECRET)
 
-        # Handle the event
-        if event.type == "checkout.session.completed":
-            session = event.data.object
-            billing_processing.handle_checkout_completed(session)
-        elif event.type == "customer.subscription.updated":
-            subscription = event.data.object
-            billing_processing.handle_subscription_updated(subscription)
-        elif event.type == "customer.subscription.deleted":
-            subscription = event.data.object
-            billing_processing.handle_subscription_deleted(subscription)
-        elif event.type == "invoice.payment_succeeded":
-            invoice = event.data.object
-            billing_processing.handle_payment_succeeded(invoice)
-        elif event.type == "invoice.payment_failed":
-            invoice = event.data.object
-            billing_processing.handle_payment_failed(invoice)
-        else:
-            logger.info(f"Unhandled event type: {event.type}")
+        if not billing_processing.claim_stripe_event(event):
+            logger.info(f"Skipping already processed Stripe event {event.id}")
+            return HttpResponse(status=200)
+
+        # Acknowledge right away and let a worker do the database writes and owner emails,
+        # so slow mail delivery can't push the response past Stripe's webhook timeout
+        from .tasks import process_stripe_event_task
+
+        process_stripe_event_task.send(request.body.decode("utf-8"))
 
         return HttpResponse(status=200)
 
     except StripeError as e:
+        billing_processing.release_stripe_event(event)
         logger.error(f"Stripe error: {str(e)}")
         return HttpResponseForbidden("Payment processing error")
     except Exception as e:
+        billing_processing.release_stripe_event(event)
         logger.exception(f"Unexpected error: {str(e)}")
         return HttpResponseForbidden("An unexpected error occurred")
@@ -25,6 +25,15 @@ logger = logging.getLogger(__name__)
 class WebhookHandler:
     """Handler for Stripe webhooks with security and idempotency."""
 
+    # Stripe event type -> name of the method handling the event's data object
+    EVENT_HANDLERS = {
+        "checkout.session.completed": "_handle_checkout_completed",
+        "customer.subscription.updated": "_handle_subscription_updated",
+        "customer.subscription.deleted": "_handle_subscription_deleted",
+        "invoice.payment_failed": "_handle_payment_failed",
+        "invoice.payment_succeeded": "_handle_payment_succeeded",
+    }
+
     def __init__(self, stripe_client=None):
         """Initialize webhook handler."""
         self.stripe_client = stripe_client or StripeClient()
@@ -57,12 +66,9 @@ class WebhookHandler:
         if not event_id:
             return False
 
+        # cache.add is atomic, so concurrent deliveries of the same event can't both pass
         key = f"webhook_event_{event_id}"
-        if cache.get(key):
-            return True
-
-        cache.set(key, True, timeout=86400)  # 24 hours
-        return False
+        return not cache.add(key, True, timeout=86400)  # 24 hours
 
     def _verify_webhook(self, request):
         """Verify webhook signature and construct event."""
@@ -99,16 +105,9 @@ class WebhookHandler:
 
         try:
             # Handle the event
-            if event.type == "checkout.session.completed":
-                self._handle_checkout_completed(event.data.object)
-            elif event.type == "customer.subscription.updated":
-                self._handle_subscription_updated(event.data.object)
-            elif event.type == "customer.subscription.deleted":
-                self._handle_subscription_deleted(event.data.object)
-            elif event.type == "invoice.payment_failed":
-                self._handle_payment_failed(event.data.object)
-            elif event.type == "invoice.payment_succeeded":
-                self._handle_payment_succeeded(event.data.object)
+            handler_name = self.EVENT_HANDLERS.get(event.type)
+            if handler_name:
+                getattr(self, handler_name)(event.data.object)
             else:
                 logger.info(f"Unhandled event type: {event.type}")
 
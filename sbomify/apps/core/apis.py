@@ -3,6 +3,7 @@ from pathlib import Path
 
 from django.conf import settings
 from django.db import DatabaseError, IntegrityError, OperationalError, transaction
+from django.db.models import CharField, F, Value
 from django.http import HttpRequest, HttpResponse
 from ninja import Query, Router
 from ninja.decorators import decorate_view
@@ -10,6 +11,7 @@ from ninja.security import django_auth
 from pydantic import BaseModel, ValidationError
 
 from sbomify.apps.access_tokens.auth import PersonalAccessTokenAuth, optional_auth, optional_token_auth
+from sbomify.apps.billing.cache import get_plan
 from sbomify.apps.billing.config import is_billing_enabled
 from sbomify.apps.billing.models import BillingPlan
 from sbomify.apps.core.object_store import S3Client
@@ -289,55 +291,62 @@ def _paginate_queryset(queryset, page: int = 1, page_size: int = 15):
     return paginated_items.object_list, pagination_meta
 
 
-def _check_billing_limits(team_id: str, resource_type: str) -> tuple[bool, str, ErrorCode | None]:
+def _check_billing_limits(team: Team, resource_type: str) -> tuple[Team | None, str, ErrorCode | None]:
     """
     Check if team has reached billing limits for the given resource type.
 
+    Must be called inside the transaction that creates the resource, after the caller's permission
+    check: for limited plans the team row is locked so that concurrent creates cannot all pass the
+    check for the last free slot.
+
     Returns:
-        (can_create, error_message, error_code): Tuple of boolean, error message, and error code
+        (team, error_message, error_code): The team to create the resource in (the locked row for
+        limited plans), or None with an error message and error code if the resource can't be created
     """
     if not is_billing_enabled():
-        return True, "", None
-
-    try:
-        team = Team.objects.get(id=team_id)
-    except Team.DoesNotExist:
-        return False, "Team not found", ErrorCode.TEAM_NOT_FOUND
+        return team, "", None
 
     if not team.billing_plan:
-        return False, "No active billing plan", ErrorCode.NO_BILLING_PLAN
+        return None, "No active billing plan", ErrorCode.NO_BILLING_PLAN
 
     try:
-        plan = BillingPlan.objects.get(key=team.billing_plan)
+        plan = get_plan(team.billing_plan)
     except BillingPlan.DoesNotExist:
-        return False, "Invalid billing plan", ErrorCode.INVALID_BILLING_PLAN
+        return None, "Invalid billing plan", ErrorCode.INVALID_BILLING_PLAN
 
-    # Get current count and limits
+    # Unlimited plans never touch the resource tables
+    if plan.is_unlimited:
+        return team, "", None
+
+    # Get the limit for this resource type
     if resource_type == "product":
-        current_count = Product.objects.filter(team_id=team_id).count()
-        max_allowed = plan.max_products
+        model_class, max_allowed = Product, plan.max_products
     elif resource_type == "project":
-        current_count = Project.objects.filter(team_id=team_id).count()
-        max_allowed = plan.max_projects
+        model_class, max_allowed = Project, plan.max_projects
     elif resource_type == "component":
-        current_count = Component.objects.filter(team_id=team_id).count()
-        max_allowed = plan.max_components
+        model_class, max_allowed = Component, plan.max_components
     else:
-        return False, f"Invalid resource type: {resource_type}", ErrorCode.INVALID_DATA
+        return None, f"Invalid resource type: {resource_type}", ErrorCode.INVALID_DATA
+
+    # A None limit means this resource type is unlimited
+    if max_allowed is None:
+        return team, "", None
+
+    # Hold the team row lock from the count until the caller's transaction has created the resource
+    team = Team.objects.select_for_update().get(pk=team.pk)
 
-    # Enterprise plan or None (unlimited) values have no limits
-    if plan.key == "enterprise" or max_allowed is None:
-        return True, "", None
+    # Only whether the limit is reached matters, so the count is capped at the limit
+    current_count = model_class.objects.filter(team=team)[:max_allowed].count()
 
     # Check if limit is reached
     if current_count >= max_allowed:
         return (
-            False,
+            None,
             f"You have reached the maximum {max_allowed} {resource_type}s allowed by your plan",
             ErrorCode.BILLING_LIMIT_EXCEEDED,
         )
 
-    return True, "", None
+    return team, "", None
 
 
 # =============================================================================
@@ -355,11 +364,6 @@ def create_product(request: HttpRequest, payload: ProductCreateSchema):
     if not team_id:
         return 403, {"detail": "No current team selected", "error_code": ErrorCode.NO_CURRENT_TEAM}
 
-    # Check billing limits
-    can_create, error_msg, error_code = _check_billing_limits(team_id, "product")
-    if not can_create:
-        return 403, {"detail": error_msg, "error_code": error_code}
-
     try:
         # Check if user has permission to create products in this team
         team = Team.objects.get(id=team_id)
@@ -367,10 +371,15 @@ def create_product(request: HttpRequest, payload: ProductCreateSchema):
             return 403, {"detail": "Only owners and admins can create products", "error_code": ErrorCode.FORBIDDEN}
 
         with transaction.atomic():
+            # Check billing limits in the same transaction as the create
+            team, error_msg, error_code = _check_billing_limits(team, "product")
+            if team is None:
+                return 403, {"detail": error_msg, "error_code": error_code}
+
             product = Product.objects.create(
                 name=payload.name,
                 description=payload.description,
-                team_id=team_id,
+                team=team,
             )
 
         return 201, _build_item_response(request, product, "product")
@@ -1121,11 +1130,6 @@ def create_project(request: HttpRequest, payload: ProjectCreateSchema):
     if not team_id:
         return 403, {"detail": "No current team selected", "error_code": ErrorCode.NO_CURRENT_TEAM}
 
-    # Check billing limits
-    can_create, error_msg, error_code = _check_billing_limits(team_id, "project")
-    if not can_create:
-        return 403, {"detail": error_msg, "error_code": error_code}
-
     try:
         # Check if user has permission to create projects in this team
         team = Team.objects.get(id=team_id)
@@ -1133,9 +1137,14 @@ def create_project(request: HttpRequest, payload: ProjectCreateSchema):
             return 403, {"detail": "Only owners and admins can create projects", "error_code": ErrorCode.FORBIDDEN}
 
         with transaction.atomic():
+            # Check billing limits in the same transaction as the create
+            team, error_msg, error_code = _check_billing_limits(team, "project")
+            if team is None:
+                return 403, {"detail": error_msg, "error_code": error_code}
+
             project = Project.objects.create(
                 name=payload.name,
-                team_id=team_id,
+                team=team,
                 metadata=payload.metadata,
             )
 
@@ -1393,11 +1402,6 @@ def create_component(request: HttpRequest, payload: ComponentCreateSchema):
     if not team_id:
         return 403, {"detail": "No current team selected", "error_code": ErrorCode.NO_CURRENT_TEAM}
 
-    # Check billing limits
-    can_create, error_msg, error_code = _check_billing_limits(team_id, "component")
-    if not can_create:
-        return 403, {"detail": error_msg, "error_code": error_code}
-
     try:
         # Check if user has permission to create components in this team
         team = Team.objects.get(id=team_id)
@@ -1405,9 +1409,14 @@ def create_component(request: HttpRequest, payload: ComponentCreateSchema):
             return 403, {"detail": "Only owners and admins can create components", "error_code": ErrorCode.FORBIDDEN}
 
         with transaction.atomic():
+            # Check billing limits in the same transaction as the create
+            team, error_msg, error_code = _check_billing_limits(team, "component")
+            if team is None:
+                return 403, {"detail": error_msg, "error_code": error_code}
+
             component = Component.objects.create(
                 name=payload.name,
-                team_id=team_id,
+                team=team,
                 component_type=payload.component_type,
                 metadata=payload.metadata,
             )
@@ -2675,7 +2684,9 @@ def list_release_artifacts(
     if mode == "existing":
         # Return artifacts that are already in this release
         existing_artifacts_queryset = (
-            ReleaseArtifact.objects.filter(release=release).select_related("sbom", "document").order_by("-created_at")
+            ReleaseArtifact.objects.filter(release=release)
+            .select_related("sbom__component", "document__component")
+            .order_by("-created_at")
         )
 
         # Extract pagination parameters properly
@@ -2732,69 +2743,68 @@ def list_release_artifacts(
         ).distinct()
 
         # Get existing artifacts in this release to exclude them
-        existing_sbom_ids = set(
-            ReleaseArtifact.objects.filter(release=release, sbom__isnull=False).values_list("sbom_id", flat=True)
-        )
-        existing_document_ids = set(
-            ReleaseArtifact.objects.filter(release=release, document__isnull=False).values_list(
-                "document_id", flat=True
-            )
+        existing_sbom_ids = set()
+        existing_document_ids = set()
+        for sbom_id, document_id in ReleaseArtifact.objects.filter(release=release).values_list(
+            "sbom_id", "document_id"
+        ):
+            if sbom_id:
+                existing_sbom_ids.add(sbom_id)
+            elif document_id:
+                existing_document_ids.add(document_id)
+
+        artifact_fields = (
+            "id",
+            "artifact_type",
+            "artifact_name",
+            "artifact_component_id",
+            "artifact_component_name",
+            "sbom_format",
+            "sbom_format_version",
+            "document_type_name",
+            "artifact_version",
+            "artifact_created_at",
         )
 
-        available_artifacts = []
-
-        # Add available SBOMs
+        # Available SBOMs and Documents are fetched as one UNION ALL, sorted and paginated by the database
         available_sboms = (
             SBOM.objects.filter(component__in=product_components)
             .exclude(id__in=existing_sbom_ids)
-            .order_by("-created_at")
-        )
-
-        for sbom in available_sboms:
-            available_artifacts.append(
-                {
-                    "id": str(sbom.id),
-                    "artifact_type": "sbom",
-                    "name": sbom.name,
-                    "component": {
-                        "id": str(sbom.component.id),
-                        "name": sbom.component.name,
-                    },
-                    "format": sbom.format,
-                    "format_version": sbom.format_version,
-                    "version": sbom.version or "",
-                    "created_at": sbom.created_at.isoformat(),
-                }
+            .annotate(
+                artifact_type=Value("sbom"),
+                artifact_name=F("name"),
+                artifact_component_id=F("component_id"),
+                artifact_component_name=F("component__name"),
+                sbom_format=F("format"),
+                sbom_format_version=F("format_version"),
+                document_type_name=Value(None, output_field=CharField()),
+                artifact_version=F("version"),
+                artifact_created_at=F("created_at"),
             )
-
-        # Add available Documents
+            .values(*artifact_fields)
+            .order_by()
+        )
         available_documents = (
             Document.objects.filter(component__in=product_components)
             .exclude(id__in=existing_document_ids)
-            .order_by("-created_at")
-        )
-
-        for document in available_documents:
-            available_artifacts.append(
-                {
-                    "id": str(document.id),
-                    "artifact_type": "document",
-                    "name": document.name,
-                    "component": {
-                        "id": str(document.component.id),
-                        "name": document.component.name,
-                    },
-                    "document_type": document.document_type,
-                    "version": document.version or "",
-                    "created_at": document.created_at.isoformat(),
-                }
+            .annotate(
+                artifact_type=Value("document"),
+                artifact_name=F("name"),
+                artifact_component_id=F("component_id"),
+                artifact_component_name=F("component__name"),
+                sbom_format=Value(None, output_field=CharField()),
+                sbom_format_version=Value(None, output_field=CharField()),
+                document_type_name=F("document_type"),
+                artifact_version=F("version"),
+                artifact_created_at=F("created_at"),
             )
-
-        # Sort by created_at descending (most recent first)
-        available_artifacts.sort(key=lambda x: x["created_at"], reverse=True)
+            .values(*artifact_fields)
+            .order_by()
+        )
+        available_artifacts = available_sboms.union(available_documents, all=True).order_by("-artifact_created_at")
 
         # Apply pagination manually
-        total_items = len(available_artifacts)
+        total_items = available_artifacts.count()
 
         # Extract pagination parameters properly
         page_num = page if isinstance(page, int) else int(request.GET.get("page", 1))
@@ -2805,7 +2815,26 @@ def list_release_artifacts(
 
         start_index = (page_num - 1) * page_size_num
         end_index = start_index + page_size_num
-        paginated_artifacts = available_artifacts[start_index:end_index]
+
+        paginated_artifacts = []
+        for row in available_artifacts[start_index:end_index]:
+            artifact = {
+                "id": str(row["id"]),
+                "artifact_type": row["artifact_type"],
+                "name": row["artifact_name"],
+                "component": {
+                    "id": str(row["artifact_component_id"]),
+                    "name": row["artifact_component_name"],
+                },
+            }
+            if row["artifact_type"] == "sbom":
+                artifact["format"] = row["sbom_format"]
+                artifact["format_version"] = row["sbom_format_version"]
+            else:
+                artifact["document_type"] = row["document_type_name"]
+            artifact["version"] = row["artifact_version"] or ""
+            artifact["created_at"] = row["artifact_created_at"].isoformat()
+            paginated_artifacts.append(artifact)
 
         # Create pagination metadata
         from sbomify.apps.core.schemas import PaginationMeta
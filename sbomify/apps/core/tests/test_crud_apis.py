@@ -1423,6 +1423,34 @@ class TestBillingPlanLimitsAPI:
         error_detail = response.json()["detail"]
         assert f"maximum {plan.max_products} products" in error_detail
 
+    def test_role_check_precedes_billing_limit_api(
+        self,
+        sample_team_with_guest_member: Member,  # noqa: F811
+    ):
+        """Test that a guest on a team at its plan limit is refused by the role check, before any billing lock."""
+        client = Client()
+        team = sample_team_with_guest_member.team
+
+        self._setup_team_with_plan(team, {
+            "key": "limited_product_plan",
+            "name": "Limited Product Plan",
+            "max_products": 1,
+            "max_projects": 10,
+            "max_components": 10
+        })
+        Product.objects.create(name="Existing Product", team=team)
+
+        setup_test_session(client, team, sample_team_with_guest_member.user)
+
+        response = client.post(
+            reverse("api-1:create_product"),
+            json.dumps({"name": "Over Limit Product"}),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 403
+        assert response.json()["error_code"] == "FORBIDDEN"
+
     def test_project_creation_limits_api(
         self,
         sample_team_with_owner_member: Member,
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import json
-import os
 
 import pytest
+from django.db import connection
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from sbomify.apps.access_tokens.models import AccessToken
@@ -25,6 +26,27 @@ from sbomify.apps.teams.fixtures import sample_team_with_guest_member, sample_te
 from sbomify.apps.teams.models import Member
 
 
+def _url_template(name: str, *params: str) -> str:
+    """Resolve a URL once, leaving ``str.format`` fields for its path parameters."""
+    url = reverse(name, kwargs={param: f"__{param}__" for param in params})
+    for param in params:
+        url = url.replace(f"__{param}__", f"{{{param}}}")
+    return url
+
+
+ADD_ARTIFACTS_TO_RELEASE_URL = _url_template("api-1:add_artifacts_to_release", "release_id")
+CREATE_RELEASE_URL = reverse("api-1:create_release")
+DELETE_RELEASE_URL = _url_template("api-1:delete_release", "release_id")
+DOWNLOAD_RELEASE_URL = _url_template("api-1:download_release", "release_id")
+GET_PRODUCT_URL = _url_template("api-1:get_product", "product_id")
+GET_RELEASE_URL = _url_template("api-1:get_release", "release_id")
+LIST_ALL_RELEASES_URL = reverse("api-1:list_all_releases")
+LIST_RELEASE_ARTIFACTS_URL = _url_template("api-1:list_release_artifacts", "release_id")
+PATCH_RELEASE_URL = _url_template("api-1:patch_release", "release_id")
+REMOVE_ARTIFACT_FROM_RELEASE_URL = _url_template("api-1:remove_artifact_from_release", "release_id", "artifact_id")
+UPDATE_RELEASE_URL = _url_template("api-1:update_release", "release_id")
+
+
 @pytest.fixture
 def sample_document(sample_component: Component):  # noqa: F811
     """Create a sample document for testing."""
@@ -40,6 +62,28 @@ def sample_document(sample_component: Component):  # noqa: F811
     )
 
 
+@pytest.fixture
+def bearer_header(sample_access_token: AccessToken) -> dict[str, str]:  # noqa: F811
+    """Build the Authorization header for the sample personal access token, as test client keyword arguments."""
+    return {"HTTP_AUTHORIZATION": f"Bearer {sample_access_token.encoded_token}"}
+
+
+@pytest.fixture
+def owner_client(
+    sample_product: Product,  # noqa: F811
+    sample_team_with_owner_member: Member,  # noqa: F811
+    bearer_header: dict[str, str],
+) -> Client:
+    """Create a client logged in as the owner of the sample product's team, with that team selected.
+
+    Every request also carries the owner's personal access token.
+    """
+    client = Client(**bearer_header)
+    # Logs the user in with force_login, skipping password verification
+    setup_test_session(client, sample_product.team, sample_team_with_owner_member.user)
+    return client
+
+
 # =============================================================================
 # RELEASE CRUD TESTS
 # =============================================================================
@@ -47,24 +91,18 @@ def sample_document(sample_component: Component):  # noqa: F811
 
 @pytest.mark.django_db
 def test_create_release_success(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test successful release creation."""
-    client = Client()
-    url = reverse("api-1:create_release")
+    url = CREATE_RELEASE_URL
 
     payload = {"name": "v1.0.0", "product_id": str(sample_product.id)}
 
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
-
-    response = client.post(
+    response = owner_client.post(
         url,
-        json.dumps(payload),
+        payload,
         content_type="application/json",
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
     )
 
     assert response.status_code == 201
@@ -83,27 +121,21 @@ def test_create_release_success(
 
 @pytest.mark.django_db
 def test_create_release_duplicate_name(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test release creation with duplicate name fails."""
-    client = Client()
-    url = reverse("api-1:create_release")
+    url = CREATE_RELEASE_URL
 
     # Create first release
     Release.objects.create(product=sample_product, name="v1.0.0")
 
     payload = {"name": "v1.0.0", "product_id": str(sample_product.id)}
 
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
-
-    response = client.post(
+    response = owner_client.post(
         url,
-        json.dumps(payload),
+        payload,
         content_type="application/json",
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
     )
 
     assert response.status_code == 400
@@ -112,24 +144,18 @@ def test_create_release_duplicate_name(
 
 @pytest.mark.django_db
 def test_create_release_named_latest_fails(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test that manually creating a release named 'latest' fails."""
-    client = Client()
-    url = reverse("api-1:create_release")
+    url = CREATE_RELEASE_URL
 
     payload = {"name": "latest", "product_id": str(sample_product.id)}
 
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
-
-    response = client.post(
+    response = owner_client.post(
         url,
-        json.dumps(payload),
+        payload,
         content_type="application/json",
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
     )
 
     assert response.status_code == 400
@@ -138,25 +164,17 @@ def test_create_release_named_latest_fails(
 
 @pytest.mark.django_db
 def test_list_releases(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test listing releases for a product."""
-    client = Client()
-    url = reverse("api-1:list_all_releases") + f"?product_id={sample_product.id}"
+    url = LIST_ALL_RELEASES_URL + f"?product_id={sample_product.id}"
 
     # Create test releases
     release1 = Release.objects.create(product=sample_product, name="v1.0.0")
     release2 = Release.objects.create(product=sample_product, name="v2.0.0")
 
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
-
-    response = client.get(
-        url,
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
-    )
+    response = owner_client.get(url)
 
     assert response.status_code == 200
     data = response.json()
@@ -185,7 +203,6 @@ def test_list_releases(
 def test_list_releases_public_product_no_auth(sample_product):  # noqa: F811
     """Test listing releases for a public product without authentication."""
     from django.test import Client
-    from django.urls import reverse
 
     from sbomify.apps.core.models import Release
 
@@ -198,7 +215,7 @@ def test_list_releases_public_product_no_auth(sample_product):  # noqa: F811
     release2 = Release.objects.create(product=sample_product, name="v2.0.0")
 
     client = Client()
-    url = reverse("api-1:list_all_releases") + f"?product_id={sample_product.id}"
+    url = LIST_ALL_RELEASES_URL + f"?product_id={sample_product.id}"
 
     # Should work without authentication for public products
     response = client.get(url)
@@ -226,26 +243,17 @@ def test_list_releases_public_product_no_auth(sample_product):  # noqa: F811
 
 @pytest.mark.django_db
 def test_list_releases_pagination(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test that releases endpoint supports pagination."""
-    client = Client()
-    url = reverse("api-1:list_all_releases") + f"?product_id={sample_product.id}"
+    url = LIST_ALL_RELEASES_URL + f"?product_id={sample_product.id}"
 
     # Create many releases to test pagination
-    for i in range(25):
-        Release.objects.create(product=sample_product, name=f"v{i}.0.0")
-
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
+    Release.objects.bulk_create([Release(product=sample_product, name=f"v{i}.0.0") for i in range(25)])
 
     # Test first page with default page size
-    response = client.get(
-        url,
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
-    )
+    response = owner_client.get(url)
 
     assert response.status_code == 200
     data = response.json()
@@ -263,10 +271,7 @@ def test_list_releases_pagination(
     assert len(data["items"]) == 15
 
     # Test second page
-    response = client.get(
-        url + "&page=2",
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
-    )
+    response = owner_client.get(url + "&page=2")
 
     assert response.status_code == 200
     data = response.json()
@@ -277,10 +282,7 @@ def test_list_releases_pagination(
     assert len(data["items"]) == 11  # Remaining items on last page
 
     # Test custom page size
-    response = client.get(
-        url + "&page_size=10",
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
-    )
+    response = owner_client.get(url + "&page_size=10")
 
     assert response.status_code == 200
     data = response.json()
@@ -292,22 +294,14 @@ def test_list_releases_pagination(
 
 @pytest.mark.django_db
 def test_get_release_success(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test getting a specific release."""
-    client = Client()
     release = Release.objects.create(product=sample_product, name="v1.0.0")
-    url = reverse("api-1:get_release", kwargs={"release_id": release.id})
+    url = GET_RELEASE_URL.format(release_id=release.id)
 
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
-
-    response = client.get(
-        url,
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
-    )
+    response = owner_client.get(url)
 
     assert response.status_code == 200
     data = response.json()
@@ -318,25 +312,19 @@ def test_get_release_success(
 
 @pytest.mark.django_db
 def test_update_release_success(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test successful release update."""
-    client = Client()
     release = Release.objects.create(product=sample_product, name="v1.0.0")
-    url = reverse("api-1:update_release", kwargs={"release_id": release.id})
+    url = UPDATE_RELEASE_URL.format(release_id=release.id)
 
     payload = {"name": "v1.1.0"}
 
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
-
-    response = client.put(
+    response = owner_client.put(
         url,
-        json.dumps(payload),
+        payload,
         content_type="application/json",
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
     )
 
     assert response.status_code == 200
@@ -350,26 +338,20 @@ def test_update_release_success(
 
 @pytest.mark.django_db
 def test_update_latest_release_fails(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test that updating a 'latest' release fails."""
-    client = Client()
     # Create latest release directly (simulating auto-creation)
     release = Release.objects.create(product=sample_product, name="latest", is_latest=True)
-    url = reverse("api-1:update_release", kwargs={"release_id": release.id})
+    url = UPDATE_RELEASE_URL.format(release_id=release.id)
 
     payload = {"name": "v1.0.0"}
 
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
-
-    response = client.put(
+    response = owner_client.put(
         url,
-        json.dumps(payload),
+        payload,
         content_type="application/json",
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
     )
 
     assert response.status_code == 400
@@ -378,26 +360,20 @@ def test_update_latest_release_fails(
 
 @pytest.mark.django_db
 def test_patch_release_with_unchanged_name(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test that patching a release with the same name doesn't trigger 'already exists' error."""
-    client = Client()
     release = Release.objects.create(product=sample_product, name="v1.0.0", description="Original description")
-    url = reverse("api-1:patch_release", kwargs={"release_id": release.id})
+    url = PATCH_RELEASE_URL.format(release_id=release.id)
 
     # PATCH with same name but different description - should succeed
     payload = {"name": "v1.0.0", "description": "Updated description"}
 
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
-
-    response = client.patch(
+    response = owner_client.patch(
         url,
-        json.dumps(payload),
+        payload,
         content_type="application/json",
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
     )
 
     assert response.status_code == 200
@@ -413,26 +389,20 @@ def test_patch_release_with_unchanged_name(
 
 @pytest.mark.django_db
 def test_patch_release_with_no_changes(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test that patching a release with no actual changes works correctly."""
-    client = Client()
     release = Release.objects.create(product=sample_product, name="v1.0.0", description="Test description")
-    url = reverse("api-1:patch_release", kwargs={"release_id": release.id})
+    url = PATCH_RELEASE_URL.format(release_id=release.id)
 
     # PATCH with exact same values - should succeed and not trigger database save
     payload = {"name": "v1.0.0", "description": "Test description", "is_prerelease": False}
 
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
-
-    response = client.patch(
+    response = owner_client.patch(
         url,
-        json.dumps(payload),
+        payload,
         content_type="application/json",
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
     )
 
     assert response.status_code == 200
@@ -450,26 +420,18 @@ def test_patch_release_with_no_changes(
 
 @pytest.mark.django_db
 def test_latest_release_created_on_releases_list_access(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test that accessing product releases creates a latest release if it doesn't exist."""
-    client = Client()
 
     # Verify no releases exist initially
     assert Release.objects.filter(product=sample_product).count() == 0
 
     # Access the product releases via API
-    url = reverse("api-1:list_all_releases") + f"?product_id={sample_product.id}"
+    url = LIST_ALL_RELEASES_URL + f"?product_id={sample_product.id}"
 
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
-
-    response = client.get(
-        url,
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
-    )
+    response = owner_client.get(url)
 
     assert response.status_code == 200
 
@@ -479,62 +441,43 @@ def test_latest_release_created_on_releases_list_access(
     assert data["items"][0]["name"] == "latest"
     assert data["items"][0]["is_latest"] is True
 
-    # Verify in database
-    latest_releases = Release.objects.filter(product=sample_product, is_latest=True)
-    assert latest_releases.count() == 1
+    # Verify in database, with a single query
+    releases = list(Release.objects.filter(product=sample_product).values("name", "is_latest"))
+    assert releases == [{"name": "latest", "is_latest": True}]
 
 
 @pytest.mark.django_db
 def test_latest_release_not_duplicated_on_repeated_access(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test that accessing a product multiple times doesn't create duplicate latest releases."""
-    client = Client()
 
     # Verify no releases exist initially
     assert Release.objects.filter(product=sample_product).count() == 0
 
-    url = reverse("api-1:get_product", kwargs={"product_id": sample_product.id})
-
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
+    url = GET_PRODUCT_URL.format(product_id=sample_product.id)
 
     # Access the product multiple times
     for _ in range(3):
-        response = client.get(
-            url,
-            HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
-        )
+        response = owner_client.get(url)
         assert response.status_code == 200
 
-    # Verify only one latest release exists
-    latest_releases = Release.objects.filter(product=sample_product, is_latest=True)
-    assert latest_releases.count() == 1
-
-    # Verify total releases count is still 1
-    assert Release.objects.filter(product=sample_product).count() == 1
+    # Verify the only release is the single latest release, with a single query
+    releases = list(Release.objects.filter(product=sample_product).values("name", "is_latest"))
+    assert releases == [{"name": "latest", "is_latest": True}]
 
 
 @pytest.mark.django_db
 def test_delete_release_success(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test successful release deletion."""
-    client = Client()
     release = Release.objects.create(product=sample_product, name="v1.0.0")
-    url = reverse("api-1:delete_release", kwargs={"release_id": release.id})
+    url = DELETE_RELEASE_URL.format(release_id=release.id)
 
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
-
-    response = client.delete(
-        url,
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
-    )
+    response = owner_client.delete(url)
 
     assert response.status_code == 204
 
@@ -544,23 +487,15 @@ def test_delete_release_success(
 
 @pytest.mark.django_db
 def test_delete_latest_release_fails(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test that deleting a 'latest' release fails."""
-    client = Client()
     # Create latest release directly (simulating auto-creation)
     release = Release.objects.create(product=sample_product, name="latest", is_latest=True)
-    url = reverse("api-1:delete_release", kwargs={"release_id": release.id})
+    url = DELETE_RELEASE_URL.format(release_id=release.id)
 
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
-
-    response = client.delete(
-        url,
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
-    )
+    response = owner_client.delete(url)
 
     assert response.status_code == 400
     assert "automatically managed" in response.json()["detail"]
@@ -572,177 +507,61 @@ def test_delete_latest_release_fails(
 
 
 @pytest.mark.django_db
-def test_add_sbom_to_release(
-    sample_product: Product,  # noqa: F811
-    sample_component: Component,  # noqa: F811
-    sample_sbom: SBOM,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
-):
-    """Test adding an SBOM to a release."""
-    client = Client()
-
-    # Ensure component is part of the product and same team
-    sample_component.team = sample_product.team
-    sample_component.save()
-    # Get the project from the component (there should be one from our fixture)
-    component_project = sample_component.projects.first()
-    sample_product.projects.add(component_project)
-
-    # Ensure SBOM belongs to the component
-    sample_sbom.component = sample_component
-    sample_sbom.save()
-
-    release = Release.objects.create(product=sample_product, name="v1.0.0")
-    url = reverse("api-1:add_artifacts_to_release", kwargs={"release_id": release.id})
-
-    payload = {"sbom_id": sample_sbom.id}
-
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
-
-    response = client.post(
-        url,
-        json.dumps(payload),
-        content_type="application/json",
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
-    )
-
-    assert response.status_code == 201
-    data = response.json()
-    assert data["artifact_type"] == "sbom"
-    assert data["artifact_name"] == sample_sbom.name
-
-    # Verify artifact was added to database
-    assert ReleaseArtifact.objects.filter(release=release, sbom=sample_sbom, document=None).exists()
-
-
-@pytest.mark.django_db
-def test_add_document_to_release(
+@pytest.mark.parametrize("artifact_type", ["sbom", "document"])
+def test_add_artifact_to_release(
+    request: pytest.FixtureRequest,
+    artifact_type: str,
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
     sample_component: Component,  # noqa: F811
-    sample_document: Document,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
-    """Test adding a document to a release."""
-    client = Client()
-
-    # Ensure component is part of the product and same team
-    sample_component.team = sample_product.team
-    sample_component.save()
-    # Get the project from the component (there should be one from our fixture)
-    component_project = sample_component.projects.first()
-    sample_product.projects.add(component_project)
-
-    # Ensure document belongs to the component
-    sample_document.component = sample_component
-    sample_document.save()
+    """Test adding an SBOM or a document to a release."""
+    artifact = request.getfixturevalue(f"sample_{artifact_type}")
 
     release = Release.objects.create(product=sample_product, name="v1.0.0")
-    url = reverse("api-1:add_artifacts_to_release", kwargs={"release_id": release.id})
-
-    payload = {"document_id": sample_document.id}
+    url = ADD_ARTIFACTS_TO_RELEASE_URL.format(release_id=release.id)
 
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
+    payload = {f"{artifact_type}_id": artifact.id}
 
-    response = client.post(
+    response = owner_client.post(
         url,
-        json.dumps(payload),
+        payload,
         content_type="application/json",
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
     )
 
     assert response.status_code == 201
     data = response.json()
-    assert data["artifact_type"] == "document"
-    assert data["artifact_name"] == sample_document.name
+    assert data["artifact_type"] == artifact_type
+    assert data["artifact_name"] == artifact.name
 
     # Verify artifact was added to database
-    assert ReleaseArtifact.objects.filter(release=release, sbom=None, document=sample_document).exists()
+    other_type = "document" if artifact_type == "sbom" else "sbom"
+    assert ReleaseArtifact.objects.filter(release=release, **{artifact_type: artifact, other_type: None}).exists()
 
 
 @pytest.mark.django_db
-def test_remove_sbom_from_release(
+@pytest.mark.parametrize("artifact_type", ["sbom", "document"])
+def test_remove_artifact_from_release(
+    request: pytest.FixtureRequest,
+    artifact_type: str,
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
     sample_component: Component,  # noqa: F811
-    sample_sbom: SBOM,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
-    """Test removing an SBOM from a release."""
-    client = Client()
-
-    # Ensure component is part of the product and same team
-    sample_component.team = sample_product.team
-    sample_component.save()
-    # Get the project from the component (there should be one from our fixture)
-    component_project = sample_component.projects.first()
-    sample_product.projects.add(component_project)
-
-    # Ensure SBOM belongs to the component
-    sample_sbom.component = sample_component
-    sample_sbom.save()
+    """Test removing an SBOM or a document from a release."""
+    artifact = request.getfixturevalue(f"sample_{artifact_type}")
 
     release = Release.objects.create(product=sample_product, name="v1.0.0")
-    artifact = ReleaseArtifact.objects.create(release=release, sbom=sample_sbom)
-
-    url = reverse("api-1:remove_artifact_from_release", kwargs={"release_id": release.id, "artifact_id": artifact.id})
+    release_artifact = ReleaseArtifact.objects.create(release=release, **{artifact_type: artifact})
 
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
+    url = REMOVE_ARTIFACT_FROM_RELEASE_URL.format(release_id=release.id, artifact_id=release_artifact.id)
 
-    response = client.delete(
-        url,
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
-    )
+    response = owner_client.delete(url)
 
     assert response.status_code == 204
 
     # Verify artifact was removed from database
-    assert not ReleaseArtifact.objects.filter(release=release, sbom=sample_sbom).exists()
-
-
-@pytest.mark.django_db
-def test_remove_document_from_release(
-    sample_product: Product,  # noqa: F811
-    sample_component: Component,  # noqa: F811
-    sample_document: Document,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
-):
-    """Test removing a document from a release."""
-    client = Client()
-
-    # Ensure component is part of the product and same team
-    sample_component.team = sample_product.team
-    sample_component.save()
-    # Get the project from the component (there should be one from our fixture)
-    component_project = sample_component.projects.first()
-    sample_product.projects.add(component_project)
-
-    # Ensure document belongs to the component
-    sample_document.component = sample_component
-    sample_document.save()
-
-    release = Release.objects.create(product=sample_product, name="v1.0.0")
-    artifact = ReleaseArtifact.objects.create(release=release, document=sample_document)
-
-    url = reverse("api-1:remove_artifact_from_release", kwargs={"release_id": release.id, "artifact_id": artifact.id})
-
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
-
-    response = client.delete(
-        url,
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
-    )
-
-    assert response.status_code == 204
-
-    # Verify artifact was removed from database
-    assert not ReleaseArtifact.objects.filter(release=release, document=sample_document).exists()
+    assert not ReleaseArtifact.objects.filter(release=release, **{artifact_type: artifact}).exists()
 
 
 # =============================================================================
@@ -752,15 +571,14 @@ def test_remove_document_from_release(
 
 @pytest.mark.django_db
 def test_download_release_sbom_success(
+    owner_client: Client,
     mocker,
     sample_product: Product,  # noqa: F811
     sample_component: Component,  # noqa: F811
     sample_sbom: SBOM,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
     tmp_path,
 ):
     """Test downloading consolidated SBOM for a release."""
-    client = Client()
 
     # IMPORTANT: Set product to public (required for SBOM generation)
     sample_product.is_public = True
@@ -786,30 +604,12 @@ def test_download_release_sbom_success(
     mock_get_release_sbom_package = mocker.patch("sbomify.apps.core.apis.get_release_sbom_package")
     mock_get_release_sbom_package.return_value = mock_file_path
 
-    # Ensure component is part of the product and same team
-    sample_component.team = sample_product.team
-    sample_component.save()
-    # Get the project from the component (there should be one from our fixture)
-    component_project = sample_component.projects.first()
-    sample_product.projects.add(component_project)
-
-    # Ensure SBOM belongs to the component
-    sample_sbom.component = sample_component
-    sample_sbom.save()
-
     release = Release.objects.create(product=sample_product, name="v1.0.0")
     ReleaseArtifact.objects.create(release=release, sbom=sample_sbom)
 
-    url = reverse("api-1:download_release", kwargs={"release_id": release.id})
-
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
+    url = DOWNLOAD_RELEASE_URL.format(release_id=release.id)
 
-    response = client.get(
-        url,
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
-    )
+    response = owner_client.get(url)
 
     assert response.status_code == 200
     assert response["Content-Type"] == "application/json"
@@ -829,23 +629,15 @@ def test_download_release_sbom_success(
 
 @pytest.mark.django_db
 def test_download_release_sbom_no_artifacts(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test downloading SBOM for release with no artifacts returns 404."""
-    client = Client()
 
     release = Release.objects.create(product=sample_product, name="v1.0.0")
-    url = reverse("api-1:download_release", kwargs={"release_id": release.id})
+    url = DOWNLOAD_RELEASE_URL.format(release_id=release.id)
 
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
-
-    response = client.get(
-        url,
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
-    )
+    response = owner_client.get(url)
 
     assert response.status_code == 500  # Error generating SBOM from empty release
     assert "Error generating release SBOM" in response.json()["detail"]
@@ -862,12 +654,12 @@ def test_release_operations_require_authentication():
     client = Client()
 
     # Create a product (will fail without authentication)
-    url = reverse("api-1:create_release")
+    url = CREATE_RELEASE_URL
     payload = {"name": "v1.0.0", "product_id": "test"}
 
     response = client.post(
         url,
-        json.dumps(payload),
+        payload,
         content_type="application/json",
     )
 
@@ -877,24 +669,23 @@ def test_release_operations_require_authentication():
 @pytest.mark.django_db
 def test_release_operations_require_team_member(
     sample_product: Product,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
+    bearer_header: dict[str, str],
     sample_team_with_guest_member: Member,  # noqa: F811
 ):
     """Test that release operations require proper team membership."""
     client = Client()
-    url = reverse("api-1:create_release")
+    url = CREATE_RELEASE_URL
 
     payload = {"name": "v1.0.0", "product_id": str(sample_product.id)}
 
     # Set up authentication with different team
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
     setup_test_session(client, sample_team_with_guest_member.team, sample_team_with_guest_member.user)
 
     response = client.post(
         url,
-        json.dumps(payload),
+        payload,
         content_type="application/json",
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
+        **bearer_header,
     )
 
     assert response.status_code == 403  # Forbidden - not a member of this team
@@ -903,7 +694,7 @@ def test_release_operations_require_team_member(
 @pytest.mark.django_db
 def test_guest_cannot_modify_releases(
     sample_product: Product,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
+    bearer_header: dict[str, str],
     sample_team_with_guest_member: Member,  # noqa: F811
 ):
     """Test that guest members cannot modify releases."""
@@ -914,19 +705,18 @@ def test_guest_cannot_modify_releases(
     guest_member.save()
 
     client = Client()
-    url = reverse("api-1:create_release")
+    url = CREATE_RELEASE_URL
 
     payload = {"name": "v1.0.0", "product_id": str(sample_product.id)}
 
     # Set up authentication as guest
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
     setup_test_session(client, guest_member.team, guest_member.user)
 
     response = client.post(
         url,
-        json.dumps(payload),
+        payload,
         content_type="application/json",
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
+        **bearer_header,
     )
 
     assert response.status_code == 403  # Forbidden for guests
@@ -939,23 +729,17 @@ def test_guest_cannot_modify_releases(
 
 @pytest.mark.django_db
 def test_add_duplicate_sbom_format_to_release(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
     sample_component: Component,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test that adding duplicate SBOM format from same component fails."""
-    client = Client()
-
-    # Ensure component is part of the product and same team
-    sample_component.team = sample_product.team
-    sample_component.save()
-    # Get the project from the component (there should be one from our fixture)
-    component_project = sample_component.projects.first()
-    sample_product.projects.add(component_project)
 
     # Create two SBOMs with same format for same component
-    sbom1 = SBOM.objects.create(component=sample_component, format="cyclonedx", format_version="1.6", name="SBOM 1")
-    sbom2 = SBOM.objects.create(component=sample_component, format="cyclonedx", format_version="1.6", name="SBOM 2")
+    sbom1, sbom2 = SBOM.objects.bulk_create(
+        SBOM(component=sample_component, format="cyclonedx", format_version="1.6", name=name)
+        for name in ("SBOM 1", "SBOM 2")
+    )
 
     release = Release.objects.create(product=sample_product, name="v1.0.0")
 
@@ -963,35 +747,91 @@ def test_add_duplicate_sbom_format_to_release(
     ReleaseArtifact.objects.create(release=release, sbom=sbom1)
 
     # Try to add second SBOM with same format
-    url = reverse("api-1:add_artifacts_to_release", kwargs={"release_id": release.id})
+    url = ADD_ARTIFACTS_TO_RELEASE_URL.format(release_id=release.id)
     payload = {"sbom_id": sbom2.id}
 
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
-
-    response = client.post(
+    response = owner_client.post(
         url,
-        json.dumps(payload),
+        payload,
         content_type="application/json",
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
     )
 
     assert response.status_code == 400
     assert "already contains an SBOM of format" in response.json()["detail"]
 
 
+@pytest.mark.django_db
+def test_add_same_sbom_to_release_twice_fails(
+    owner_client: Client,
+    sample_product: Product,  # noqa: F811
+    sample_component: Component,  # noqa: F811
+    sample_sbom: SBOM,  # noqa: F811
+):
+    """Test that adding an SBOM already in the release is reported as such."""
+
+    release = Release.objects.create(product=sample_product, name="v1.0.0")
+    ReleaseArtifact.objects.create(release=release, sbom=sample_sbom)
+
+    response = owner_client.post(
+        ADD_ARTIFACTS_TO_RELEASE_URL.format(release_id=release.id),
+        {"sbom_id": sample_sbom.id},
+        content_type="application/json",
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Artifact already exists in this release"
+    assert ReleaseArtifact.objects.filter(release=release).count() == 1
+
+
+@pytest.mark.django_db
+def test_add_sbom_already_in_release_with_same_format_sibling(
+    owner_client: Client,
+    sample_product: Product,  # noqa: F811
+    sample_component: Component,  # noqa: F811
+):
+    """Test that an SBOM already in the release is found even when a same-format sibling is attached too."""
+    from sbomify.apps.core.utils import add_artifact_to_release
+
+    sbom1, sbom2 = SBOM.objects.bulk_create(
+        SBOM(component=sample_component, format="cyclonedx", format_version="1.6", name=name)
+        for name in ("SBOM 1", "SBOM 2")
+    )
+
+    release = Release.objects.create(product=sample_product, name="v1.0.0")
+    ReleaseArtifact.objects.bulk_create(ReleaseArtifact(release=release, sbom=sbom) for sbom in (sbom1, sbom2))
+
+    for sbom in (sbom1, sbom2):
+        response = owner_client.post(
+            ADD_ARTIFACTS_TO_RELEASE_URL.format(release_id=release.id),
+            {"sbom_id": sbom.id},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Artifact already exists in this release"
+
+        # Replacement must not delete the sibling and then collide with the existing row
+        result = add_artifact_to_release(release, sbom=sbom, allow_replacement=True)
+
+        assert result["replaced"] is False
+        assert result["artifact"].sbom_id == sbom.id
+
+    assert set(ReleaseArtifact.objects.filter(release=release).values_list("sbom_id", flat=True)) == {
+        sbom1.id,
+        sbom2.id,
+    }
+
+
 @pytest.mark.django_db
 def test_add_sbom_from_different_team_fails(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
     sample_component: Component,  # noqa: F811
     sample_sbom: SBOM,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test that adding SBOM from different team fails."""
     from sbomify.apps.teams.models import Team
 
-    client = Client()
 
     # Create a different team explicitly
     different_team = Team.objects.create(name="different team")
@@ -1003,19 +843,14 @@ def test_add_sbom_from_different_team_fails(
     sample_sbom.save()
 
     release = Release.objects.create(product=sample_product, name="v1.0.0")
-    url = reverse("api-1:add_artifacts_to_release", kwargs={"release_id": release.id})
+    url = ADD_ARTIFACTS_TO_RELEASE_URL.format(release_id=release.id)
 
     payload = {"sbom_id": sample_sbom.id}
 
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
-
-    response = client.post(
+    response = owner_client.post(
         url,
-        json.dumps(payload),
+        payload,
         content_type="application/json",
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
     )
 
     assert response.status_code == 403  # SBOM belongs to a different team
@@ -1023,100 +858,66 @@ def test_add_sbom_from_different_team_fails(
 
 @pytest.mark.django_db
 def test_list_available_artifacts_for_release(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
     sample_component: Component,  # noqa: F811
     sample_sbom: SBOM,  # noqa: F811
     sample_document: Document,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test listing available artifacts for a release."""
-    client = Client()
-
-    # Ensure component is part of the product and same team
-    sample_component.team = sample_product.team
-    sample_component.save()
-    # Get the project from the component (there should be one from our fixture)
-    component_project = sample_component.projects.first()
-    sample_product.projects.add(component_project)
-
-    # Ensure artifacts belong to the component
-    sample_sbom.component = sample_component
-    sample_sbom.save()
-    sample_document.component = sample_component
-    sample_document.save()
 
     release = Release.objects.create(product=sample_product, name="v1.0.0")
-    url = reverse("api-1:list_release_artifacts", kwargs={"release_id": release.id})
-
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
+    url = LIST_RELEASE_ARTIFACTS_URL.format(release_id=release.id)
 
-    response = client.get(
-        url,
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
-    )
+    response = owner_client.get(url)
 
     assert response.status_code == 200
     data = response.json()
 
     # Should have both SBOM and document
     assert len(data["items"]) == 2
+    by_type = {item["artifact_type"]: item for item in data["items"]}
+    assert by_type.keys() == {"sbom", "document"}
 
     # Check SBOM data
-    sbom_artifact = next((item for item in data["items"] if item["artifact_type"] == "sbom"), None)
-    assert sbom_artifact is not None
+    sbom_artifact = by_type["sbom"]
     assert sbom_artifact["id"] == sample_sbom.id
     assert sbom_artifact["name"] == sample_sbom.name
     assert sbom_artifact["component"]["name"] == sample_component.name
+    assert sbom_artifact["format"] == sample_sbom.format
+    assert sbom_artifact["format_version"] == sample_sbom.format_version
 
     # Check document data
-    doc_artifact = next((item for item in data["items"] if item["artifact_type"] == "document"), None)
-    assert doc_artifact is not None
+    doc_artifact = by_type["document"]
     assert doc_artifact["id"] == sample_document.id
     assert doc_artifact["name"] == sample_document.name
     assert doc_artifact["component"]["name"] == sample_component.name
+    assert doc_artifact["document_type"] == sample_document.document_type
+
+    # Most recently created first
+    assert [item["created_at"] for item in data["items"]] == sorted(
+        (item["created_at"] for item in data["items"]), reverse=True
+    )
 
 
 @pytest.mark.django_db
 def test_list_available_artifacts_excludes_existing(
+    owner_client: Client,
     sample_product: Product,  # noqa: F811
     sample_component: Component,  # noqa: F811
     sample_sbom: SBOM,  # noqa: F811
     sample_document: Document,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
 ):
     """Test that available artifacts excludes those already in the release."""
-    client = Client()
-
-    # Ensure component is part of the product and same team
-    sample_component.team = sample_product.team
-    sample_component.save()
-    # Get the project from the component (there should be one from our fixture)
-    component_project = sample_component.projects.first()
-    sample_product.projects.add(component_project)
-
-    # Ensure artifacts belong to the component
-    sample_sbom.component = sample_component
-    sample_sbom.save()
-    sample_document.component = sample_component
-    sample_document.save()
 
     release = Release.objects.create(product=sample_product, name="v1.0.0")
 
     # Add SBOM to release (but not document)
     ReleaseArtifact.objects.create(release=release, sbom=sample_sbom)
 
-    url = reverse("api-1:list_release_artifacts", kwargs={"release_id": release.id})
+    url = LIST_RELEASE_ARTIFACTS_URL.format(release_id=release.id)
 
-    # Set up authentication and session
-    assert client.login(username=os.environ["DJANGO_TEST_USER"], password=os.environ["DJANGO_TEST_PASSWORD"])
-    setup_test_session(client, sample_product.team, sample_product.team.members.first())
-
-    response = client.get(
-        url,
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
-    )
+    response = owner_client.get(url)
 
     assert response.status_code == 200
     data = response.json()
@@ -1127,10 +928,36 @@ def test_list_available_artifacts_excludes_existing(
     assert data["items"][0]["id"] == sample_document.id
 
 
+@pytest.mark.django_db
+def test_list_available_artifacts_query_count_is_constant(
+    owner_client: Client,
+    sample_product: Product,  # noqa: F811
+    sample_component: Component,  # noqa: F811
+    sample_sbom: SBOM,  # noqa: F811
+):
+    """Test that listing available artifacts doesn't issue a query per artifact."""
+
+    release = Release.objects.create(product=sample_product, name="v1.0.0")
+    url = LIST_RELEASE_ARTIFACTS_URL.format(release_id=release.id)
+
+    with CaptureQueriesContext(connection) as single_sbom_queries:
+        assert owner_client.get(url).status_code == 200
+
+    SBOM.objects.bulk_create(
+        SBOM(component=sample_component, name=f"extra-{i}", format="cyclonedx", format_version="1.6") for i in range(3)
+    )
+
+    with CaptureQueriesContext(connection) as many_sbom_queries:
+        response = owner_client.get(url)
+
+    assert len(response.json()["items"]) == 4
+    assert len(many_sbom_queries) == len(single_sbom_queries)
+
+
 @pytest.mark.django_db
 def test_update_release_date(
     sample_product: Product,  # noqa: F811
-    sample_access_token: AccessToken,  # noqa: F811
+    bearer_header: dict[str, str],
 ):
     """Test updating release creation date."""
     from datetime import datetime, timezone
@@ -1144,14 +971,14 @@ def test_update_release_date(
     # Set a new date
     new_date = datetime(2023, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
 
-    url = reverse("api-1:update_release", kwargs={"release_id": release.id})
+    url = UPDATE_RELEASE_URL.format(release_id=release.id)
     data = {"name": "v1.0.0", "description": "Test release", "is_prerelease": False, "created_at": new_date.isoformat()}
 
     response = client.put(
         url,
-        data=json.dumps(data),
+        data,
         content_type="application/json",
-        HTTP_AUTHORIZATION=f"Bearer {sample_access_token.encoded_token}",
+        **bearer_header,
     )
 
     assert response.status_code == 200
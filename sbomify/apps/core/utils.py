@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from secrets import token_urlsafe
 from typing import Any
 
+from django.db.models import Case, When
 from django.http import HttpRequest
 
 logger = logging.getLogger(__name__)
@@ -296,13 +297,33 @@ def add_artifact_to_release(release, sbom=None, document=None, allow_replacement
     if sbom and document:
         raise ValueError("Cannot provide both sbom and document")
 
-    # Check if artifact already exists in this release
+    # A single lookup covers both the artifact itself and any other artifact of the same
+    # format/type from the same component, since the artifact always matches its own format/type.
+    # The artifact itself sorts first, as the release may hold several of that format/type.
     if sbom:
-        existing = ReleaseArtifact.objects.filter(release=release, sbom=sbom).first()
+        existing = (
+            ReleaseArtifact.objects.filter(
+                release=release, sbom__component_id=sbom.component_id, sbom__format=sbom.format
+            )
+            .select_related("sbom")
+            .order_by(Case(When(sbom=sbom, then=0), default=1))
+            .first()
+        )
+        already_included = existing is not None and existing.sbom_id == sbom.id
     else:
-        existing = ReleaseArtifact.objects.filter(release=release, document=document).first()
-
-    if existing:
+        existing = (
+            ReleaseArtifact.objects.filter(
+                release=release,
+                document__component_id=document.component_id,
+                document__document_type=document.document_type,
+            )
+            .select_related("document")
+            .order_by(Case(When(document=document, then=0), default=1))
+            .first()
+        )
+        already_included = existing is not None and existing.document_id == document.id
+
+    if already_included:
         # Artifact already exists - no action needed
         return {
             "created": False,
@@ -313,10 +334,8 @@ def add_artifact_to_release(release, sbom=None, document=None, allow_replacement
 
     # Handle duplicate formats based on allow_replacement setting
     if sbom:
-        # For SBOMs: check for existing SBOM of same format from same component
-        existing_sbom_artifact = ReleaseArtifact.objects.filter(
-            release=release, sbom__component=sbom.component, sbom__format=sbom.format
-        ).first()
+        # For SBOMs: an existing SBOM of same format from same component
+        existing_sbom_artifact = existing
 
         if existing_sbom_artifact:
             if not allow_replacement:
@@ -341,10 +360,8 @@ def add_artifact_to_release(release, sbom=None, document=None, allow_replacement
                 return {"created": False, "replaced": True, "artifact": new_artifact, "replaced_info": replaced_info}
 
     else:  # document
-        # For Documents: check for existing document of same type from same component
-        existing_doc_artifact = ReleaseArtifact.objects.filter(
-            release=release, document__component=document.component, document__document_type=document.document_type
-        ).first()
+        # For Documents: an existing document of same type from same component
+        existing_doc_artifact = existing
 
         if existing_doc_artifact:
             if not allow_replacement:
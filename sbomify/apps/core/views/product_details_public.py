@@ -4,7 +4,7 @@ from django.views import View
 
 from sbomify.apps.core.apis import get_product
 from sbomify.apps.core.errors import error_response
-from sbomify.apps.sboms.models import SBOM
+from sbomify.apps.sboms.models import SBOM, ProductProject, ProjectComponent
 
 
 class ProductDetailsPublicView(View):
@@ -15,7 +15,11 @@ class ProductDetailsPublicView(View):
                 request, HttpResponse(status=status_code, content=product.get("detail", "Unknown error"))
             )
 
-        has_downloadable_content = SBOM.objects.filter(component__projects__products__id=product_id).exists()
+        # Walk the product -> project -> component link tables directly instead of joining
+        # through the project and component tables
+        product_projects = ProductProject.objects.filter(product_id=product_id).values("project_id")
+        product_components = ProjectComponent.objects.filter(project_id__in=product_projects).values("component_id")
+        has_downloadable_content = SBOM.objects.filter(component_id__in=product_components).exists()
         current_team = request.session.get("current_team", {})
         brand = current_team.get("branding_info")
 
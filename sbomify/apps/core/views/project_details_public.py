@@ -4,7 +4,7 @@ from django.views import View
 
 from sbomify.apps.core.apis import get_project
 from sbomify.apps.core.errors import error_response
-from sbomify.apps.sboms.models import SBOM
+from sbomify.apps.sboms.models import SBOM, ProjectComponent
 
 
 class ProjectDetailsPublicView(View):
@@ -15,7 +15,9 @@ class ProjectDetailsPublicView(View):
                 request, HttpResponse(status=status_code, content=project.get("detail", "Unknown error"))
             )
 
-        has_downloadable_content = SBOM.objects.filter(component__projects=project["id"]).exists()
+        # Probe the project -> component link table directly instead of joining through components
+        project_components = ProjectComponent.objects.filter(project_id=project["id"]).values("component_id")
+        has_downloadable_content = SBOM.objects.filter(component_id__in=project_components).exists()
         current_team = request.session.get("current_team", {})
         brand = current_team.get("branding_info")
 
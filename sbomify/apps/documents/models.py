@@ -100,44 +100,12 @@ class Document(models.Model):
     @property
     def cyclonedx_external_ref_type(self) -> str:
         """Get the corresponding CycloneDX external reference type."""
-        cyclonedx_mapping = {
-            self.DocumentType.SPECIFICATION: "documentation",
-            self.DocumentType.MANUAL: "documentation",
-            self.DocumentType.README: "documentation",
-            self.DocumentType.DOCUMENTATION: "documentation",
-            self.DocumentType.BUILD_INSTRUCTIONS: "build-meta",
-            self.DocumentType.CONFIGURATION: "configuration",
-            self.DocumentType.LICENSE: "license",
-            self.DocumentType.COMPLIANCE: "certification-report",
-            self.DocumentType.EVIDENCE: "evidence",
-            self.DocumentType.CHANGELOG: "release-notes",
-            self.DocumentType.RELEASE_NOTES: "release-notes",
-            self.DocumentType.SECURITY_ADVISORY: "advisories",
-            self.DocumentType.VULNERABILITY_REPORT: "vulnerability-assertion",
-            self.DocumentType.THREAT_MODEL: "threat-model",
-            self.DocumentType.RISK_ASSESSMENT: "risk-assessment",
-            self.DocumentType.PENTEST_REPORT: "pentest-report",
-            self.DocumentType.STATIC_ANALYSIS: "static-analysis-report",
-            self.DocumentType.DYNAMIC_ANALYSIS: "dynamic-analysis-report",
-            self.DocumentType.QUALITY_METRICS: "quality-metrics",
-            self.DocumentType.MATURITY_REPORT: "maturity-report",
-            self.DocumentType.REPORT: "other",
-            self.DocumentType.OTHER: "other",
-        }
-        return cyclonedx_mapping.get(self.document_type, "other")
+        return _CYCLONEDX_EXTERNAL_REF_TYPES.get(self.document_type, "other")
 
     @property
     def spdx_reference_category(self) -> str:
         """Get the corresponding SPDX reference category."""
-        security_types = {
-            self.DocumentType.SECURITY_ADVISORY,
-            self.DocumentType.VULNERABILITY_REPORT,
-            self.DocumentType.THREAT_MODEL,
-            self.DocumentType.RISK_ASSESSMENT,
-            self.DocumentType.PENTEST_REPORT,
-        }
-
-        if self.document_type in security_types:
+        if self.document_type in _SPDX_SECURITY_TYPES:
             return "SECURITY"
         else:
             return "OTHER"
@@ -145,32 +113,70 @@ class Document(models.Model):
     @property
     def spdx_reference_type(self) -> str:
         """Get the corresponding SPDX reference type."""
-        spdx_mapping = {
-            self.DocumentType.SPECIFICATION: "specification",
-            self.DocumentType.MANUAL: "manual",
-            self.DocumentType.README: "readme",
-            self.DocumentType.DOCUMENTATION: "documentation",
-            self.DocumentType.BUILD_INSTRUCTIONS: "build-instructions",
-            self.DocumentType.CONFIGURATION: "configuration",
-            self.DocumentType.LICENSE: "license",
-            self.DocumentType.COMPLIANCE: "compliance",
-            self.DocumentType.EVIDENCE: "evidence",
-            self.DocumentType.CHANGELOG: "changelog",
-            self.DocumentType.RELEASE_NOTES: "release-notes",
-            self.DocumentType.SECURITY_ADVISORY: "advisory",
-            self.DocumentType.VULNERABILITY_REPORT: "vulnerability-report",
-            self.DocumentType.THREAT_MODEL: "threat-model",
-            self.DocumentType.RISK_ASSESSMENT: "risk-assessment",
-            self.DocumentType.PENTEST_REPORT: "pentest-report",
-            self.DocumentType.STATIC_ANALYSIS: "static-analysis-report",
-            self.DocumentType.DYNAMIC_ANALYSIS: "dynamic-analysis-report",
-            self.DocumentType.QUALITY_METRICS: "quality-metrics",
-            self.DocumentType.MATURITY_REPORT: "maturity-report",
-            self.DocumentType.REPORT: "report",
-            self.DocumentType.OTHER: "other",
-        }
-        return spdx_mapping.get(self.document_type, "other")
+        return _SPDX_REFERENCE_TYPES.get(self.document_type, "other")
 
     def get_external_reference_url(self) -> str:
         """Get the external reference URL for this document."""
         return f"/api/v1/documents/{self.id}/download"
+
+
+# Mappings from document type to SBOM reference types, built once rather than on every property access
+_CYCLONEDX_EXTERNAL_REF_TYPES = {
+    Document.DocumentType.SPECIFICATION: "documentation",
+    Document.DocumentType.MANUAL: "documentation",
+    Document.DocumentType.README: "documentation",
+    Document.DocumentType.DOCUMENTATION: "documentation",
+    Document.DocumentType.BUILD_INSTRUCTIONS: "build-meta",
+    Document.DocumentType.CONFIGURATION: "configuration",
+    Document.DocumentType.LICENSE: "license",
+    Document.DocumentType.COMPLIANCE: "certification-report",
+    Document.DocumentType.EVIDENCE: "evidence",
+    Document.DocumentType.CHANGELOG: "release-notes",
+    Document.DocumentType.RELEASE_NOTES: "release-notes",
+    Document.DocumentType.SECURITY_ADVISORY: "advisories",
+    Document.DocumentType.VULNERABILITY_REPORT: "vulnerability-assertion",
+    Document.DocumentType.THREAT_MODEL: "threat-model",
+    Document.DocumentType.RISK_ASSESSMENT: "risk-assessment",
+    Document.DocumentType.PENTEST_REPORT: "pentest-report",
+    Document.DocumentType.STATIC_ANALYSIS: "static-analysis-report",
+    Document.DocumentType.DYNAMIC_ANALYSIS: "dynamic-analysis-report",
+    Document.DocumentType.QUALITY_METRICS: "quality-metrics",
+    Document.DocumentType.MATURITY_REPORT: "maturity-report",
+    Document.DocumentType.REPORT: "other",
+    Document.DocumentType.OTHER: "other",
+}
+
+_SPDX_SECURITY_TYPES = frozenset(
+    {
+        Document.DocumentType.SECURITY_ADVISORY,
+        Document.DocumentType.VULNERABILITY_REPORT,
+        Document.DocumentType.THREAT_MODEL,
+        Document.DocumentType.RISK_ASSESSMENT,
+        Document.DocumentType.PENTEST_REPORT,
+    }
+)
+
+_SPDX_REFERENCE_TYPES = {
+    Document.DocumentType.SPECIFICATION: "specification",
+    Document.DocumentType.MANUAL: "manual",
+    Document.DocumentType.README: "readme",
+    Document.DocumentType.DOCUMENTATION: "documentation",
+    Document.DocumentType.BUILD_INSTRUCTIONS: "build-instructions",
+    Document.DocumentType.CONFIGURATION: "configuration",
+    Document.DocumentType.LICENSE: "license",
+    Document.DocumentType.COMPLIANCE: "compliance",
+    Document.DocumentType.EVIDENCE: "evidence",
+    Document.DocumentType.CHANGELOG: "changelog",
+    Document.DocumentType.RELEASE_NOTES: "release-notes",
+    Document.DocumentType.SECURITY_ADVISORY: "advisory",
+    Document.DocumentType.VULNERABILITY_REPORT: "vulnerability-report",
+    Document.DocumentType.THREAT_MODEL: "threat-model",
+    Document.DocumentType.RISK_ASSESSMENT: "risk-assessment",
+    Document.DocumentType.PENTEST_REPORT: "pentest-report",
+    Document.DocumentType.STATIC_ANALYSIS: "static-analysis-report",
+    Document.DocumentType.DYNAMIC_ANALYSIS: "dynamic-analysis-report",
+    Document.DocumentType.QUALITY_METRICS: "quality-metrics",
+    Document.DocumentType.MATURITY_REPORT: "maturity-report",
+    Document.DocumentType.REPORT: "report",
+    Document.DocumentType.OTHER: "other",
+}
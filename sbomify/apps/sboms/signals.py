@@ -1,7 +1,14 @@
+import logging
+
+from django.db import DatabaseError, transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from dramatiq.errors import DramatiqError
+from redis.exceptions import RedisError  # raised by the Redis broker on outages; not a DramatiqError
 
+from sbomify.apps.billing.cache import get_plan
 from sbomify.apps.billing.models import BillingPlan
+from sbomify.apps.teams.models import Team
 from sbomify.logging import getLogger
 
 from .models import SBOM
@@ -13,77 +20,101 @@ logger = getLogger(__name__)
 # License processing is now handled directly during SBOM upload via ComponentLicense model
 
 
-@receiver(post_save, sender=SBOM)
-def trigger_ntia_compliance_check(sender, instance, created, **kwargs):
-    """Trigger NTIA compliance checking task when a new SBOM is created."""
-    if created:
+@receiver(post_save, sender=SBOM, dispatch_uid="sboms_trigger_sbom_tasks")
+def trigger_sbom_tasks(sender, instance, created, **kwargs):
+    """Trigger NTIA compliance checking and vulnerability scanning when a new SBOM is created."""
+    if not created:
+        return
+
+    # Queue the tasks only once the SBOM row is committed, so a worker never looks up an SBOM it can't see yet.
+    # Outside a transaction (autocommit) on_commit runs the callback immediately.
+    sbom_id = instance.id
+    component_id = instance.component_id
+    # robust: an unexpected error is logged by Django instead of failing the request that created the SBOM
+    transaction.on_commit(lambda: _dispatch_sbom_tasks(sbom_id, component_id), robust=True)
+
+
+def _dispatch_sbom_tasks(sbom_id, component_id):
+    """Queue the NTIA compliance check and vulnerability scan for a committed SBOM."""
+    try:
+        # Both tasks depend on the team's billing plan, so resolve it once for the two of them.
+        # Only the team and plan keys are needed, so read them without loading the component and team.
+        team_keys = Team.objects.filter(component__id=component_id).values_list("key", "billing_plan")
+        team_row = team_keys.first()
+        if team_row is None:
+            logger.error("Failed to trigger tasks for SBOM %s: no team found for its component", sbom_id)
+            return
+
+        team_key, plan_key = team_row
+
+        # Community teams (no billing plan) are the common case: no plan to resolve and no NTIA check
+        if not plan_key:
+            logger.debug("Skipping NTIA compliance check for SBOM %s - no billing plan (community)", sbom_id)
+            _trigger_vulnerability_scan(sbom_id, team_key, plan_key, None)
+            return
+
+        # Team.billing_plan is a plain CharField holding BillingPlan.key (unique, so indexed), not a foreign key
         try:
-            # Check if the team's billing plan includes NTIA compliance
-            team = instance.component.team
-
-            # If no billing plan, skip NTIA check (community default)
-            if not team.billing_plan:
-                logger.info(f"Skipping NTIA compliance check for SBOM {instance.id} - no billing plan (community)")
-                return
-
-            try:
-                plan = BillingPlan.objects.get(key=team.billing_plan)
-                if not plan.has_ntia_compliance:
-                    logger.info(
-                        f"Skipping NTIA compliance check for SBOM {instance.id} - "
-                        f"plan '{plan.key}' does not include NTIA compliance"
-                    )
-                    return
-            except BillingPlan.DoesNotExist:
-                logger.warning(f"Billing plan not found for team {team.key}, skipping NTIA compliance check")
-                return
-
-            # Proceed with NTIA compliance check for business/enterprise plans
-            from sbomify.tasks import check_sbom_ntia_compliance
+            plan = get_plan(plan_key)
+        except BillingPlan.DoesNotExist:
+            plan = None
+    except DatabaseError as e:
+        logger.error("Failed to trigger tasks for SBOM %s: %s", sbom_id, e, exc_info=True)
+        return
+
+    _trigger_ntia_compliance_check(sbom_id, team_key, plan)
+    _trigger_vulnerability_scan(sbom_id, team_key, plan_key, plan)
+
+
+def _trigger_ntia_compliance_check(sbom_id, team_key, plan):
+    """Trigger the NTIA compliance checking task if the team's billing plan includes it."""
+    try:
+        if plan is None:
+            logger.warning("Billing plan not found for team %s, skipping NTIA compliance check", team_key)
+            return
 
+        if not plan.has_ntia_compliance:
             logger.info(
-                f"Triggering NTIA compliance check for SBOM {instance.id} - plan '{plan.key}' includes NTIA compliance"
-            )
-            # Add a 60 second delay to ensure transaction is committed and to stagger after license processing
-            check_sbom_ntia_compliance.send_with_options(args=[instance.id], delay=60000)
-
-        except (AttributeError, ImportError) as e:
-            logger.error(f"Failed to trigger NTIA compliance check for SBOM {instance.id}: {e}", exc_info=True)
-        except Exception as e:
-            logger.error(
-                f"Unexpected error triggering NTIA compliance check for SBOM {instance.id}: {e}", exc_info=True
+                "Skipping NTIA compliance check for SBOM %s - plan '%s' does not include NTIA compliance",
+                sbom_id,
+                plan.key,
             )
+            return
 
+        # Proceed with NTIA compliance check for business/enterprise plans
+        from sbomify.tasks import check_sbom_ntia_compliance
+
+        logger.info(
+            "Triggering NTIA compliance check for SBOM %s - plan '%s' includes NTIA compliance", sbom_id, plan.key
+        )
+        check_sbom_ntia_compliance.send(sbom_id)
+
+    except (AttributeError, ImportError, DramatiqError, RedisError) as e:
+        logger.error("Failed to trigger NTIA compliance check for SBOM %s: %s", sbom_id, e, exc_info=True)
 
-@receiver(post_save, sender=SBOM)
-def trigger_vulnerability_scan(sender, instance, created, **kwargs):
-    """Trigger vulnerability scanning task when a new SBOM is created."""
-    if created:
-        try:
-            team = instance.component.team
 
-            # OSV vulnerability scanning is available for ALL teams (community, business, enterprise)
-            # The VulnerabilityScanningService will handle provider selection:
-            # - Community teams: OSV only
-            # - Business/Enterprise teams: OSV or Dependency Track based on team settings
+def _trigger_vulnerability_scan(sbom_id, team_key, plan_key, plan):
+    """Trigger the vulnerability scanning task."""
+    try:
+        # OSV vulnerability scanning is available for ALL teams (community, business, enterprise)
+        # The VulnerabilityScanningService will handle provider selection:
+        # - Community teams: OSV only
+        # - Business/Enterprise teams: OSV or Dependency Track based on team settings
 
-            from sbomify.tasks import scan_sbom_for_vulnerabilities_unified
+        from sbomify.tasks import scan_sbom_for_vulnerabilities_unified
 
-            # Determine plan type for logging
-            plan_info = "community (no billing plan)"
-            if team.billing_plan:
-                try:
-                    plan = BillingPlan.objects.get(key=team.billing_plan)
-                    plan_info = f"'{plan.key}' plan"
-                except BillingPlan.DoesNotExist:
-                    plan_info = "unknown plan"
+        # Determine plan type for logging, only when the message will be emitted
+        if logger.isEnabledFor(logging.INFO):
+            if not plan_key:
+                plan_info = "community (no billing plan)"
+            elif plan is None:
+                plan_info = "unknown plan"
+            else:
+                plan_info = f"'{plan.key}' plan"
 
-            logger.info(f"Triggering vulnerability scan for SBOM {instance.id} - team {team.key} with {plan_info}")
+            logger.info("Triggering vulnerability scan for SBOM %s - team %s with %s", sbom_id, team_key, plan_info)
 
-            # Add a 90 second delay to ensure transaction is committed and to stagger after NTIA compliance
-            scan_sbom_for_vulnerabilities_unified.send_with_options(args=[instance.id], delay=90000)
+        scan_sbom_for_vulnerabilities_unified.send(sbom_id)
 
-        except (AttributeError, ImportError) as e:
-            logger.error(f"Failed to trigger vulnerability scan for SBOM {instance.id}: {e}", exc_info=True)
-        except Exception as e:
-            logger.error(f"Unexpected error triggering vulnerability scan for SBOM {instance.id}: {e}", exc_info=True)
+    except (AttributeError, ImportError, DramatiqError, RedisError) as e:
+        logger.error("Failed to trigger vulnerability scan for SBOM %s: %s", sbom_id, e, exc_info=True)
@@ -285,7 +285,9 @@ class TestNTIAComplianceIntegration:
             public_detail_response = client.get(f"/public/component/{component.id}/detailed/")
             assert public_detail_response.status_code == 200
 
-    def test_signal_triggered_compliance_check(self, component, compliant_cyclonedx_sbom):
+    def test_signal_triggered_compliance_check(
+        self, component, compliant_cyclonedx_sbom, django_capture_on_commit_callbacks
+    ):
         """Test that NTIA compliance checking is triggered by SBOM creation signal."""
         # Set up team with billing plan that includes NTIA compliance
         from sbomify.apps.billing.models import BillingPlan
@@ -307,22 +309,20 @@ class TestNTIAComplianceIntegration:
         component.team.save()
 
         # Mock the task to verify it gets called
-        with patch('sbomify.tasks.check_sbom_ntia_compliance.send_with_options') as mock_task:
+        with patch('sbomify.tasks.check_sbom_ntia_compliance.send') as mock_task:
             # Create SBOM directly (simulates what happens in upload endpoints)
-            sbom = SBOM.objects.create(
-                name="test-sbom",
-                component=component,
-                format="cyclonedx",
-                format_version="1.5",
-                sbom_filename="test.json",
-                source="test"
-            )
+            with django_capture_on_commit_callbacks(execute=True):
+                sbom = SBOM.objects.create(
+                    name="test-sbom",
+                    component=component,
+                    format="cyclonedx",
+                    format_version="1.5",
+                    sbom_filename="test.json",
+                    source="test"
+                )
 
             # Verify task was scheduled
-            mock_task.assert_called_once()
-            call_args = mock_task.call_args
-            assert call_args[1]["args"] == [sbom.id]
-            assert call_args[1]["delay"] == 60000  # 60 second delay
+            mock_task.assert_called_once_with(sbom.id)
 
     def test_model_properties_and_methods(self, component):
         """Test SBOM model properties and methods for NTIA compliance."""
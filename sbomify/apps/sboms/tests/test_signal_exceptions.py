@@ -7,13 +7,27 @@ that trigger NTIA compliance checks and vulnerability scans when SBOMs are creat
 
 import pytest
 from unittest.mock import Mock, patch
+from django.db import DatabaseError, connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 from sbomify.apps.billing.models import BillingPlan
 from sbomify.apps.core.models import User, Component
 from sbomify.apps.teams.models import Team
 from sbomify.apps.sboms.models import SBOM
-from sbomify.apps.sboms.signals import trigger_ntia_compliance_check, trigger_vulnerability_scan
+from sbomify.apps.sboms.signals import trigger_sbom_tasks
+
+
+def _info_messages(mock_logger, topic):
+    """Return the formatted info messages logged about the given task."""
+    return _logged_messages(mock_logger.info, topic)
+
+
+def _logged_messages(log_method, topic):
+    """Return the formatted messages logged through a mocked logger method about the given task."""
+    messages = [call.args[0] % call.args[1:] for call in log_method.call_args_list]
+    return [message for message in messages if topic in message]
 
 
 class SignalExceptionHandlingTests(TestCase):
@@ -34,38 +48,38 @@ class SignalExceptionHandlingTests(TestCase):
             team=self.team
         )
 
-    def test_signal_handlers_not_triggered_for_updates(self):
-        """Test that signal handlers are not triggered for SBOM updates."""
+    def test_signal_handler_not_triggered_for_updates(self):
+        """Test that the signal handler is not triggered for SBOM updates."""
         sbom = SBOM.objects.create(
             name="test-sbom",
             component=self.component
         )
 
         with patch('sbomify.apps.sboms.signals.logger') as mock_logger:
-            # Trigger signals for update (created=False)
-            trigger_ntia_compliance_check(sender=SBOM, instance=sbom, created=False)
-            trigger_vulnerability_scan(sender=SBOM, instance=sbom, created=False)
+            # Trigger signal for update (created=False)
+            with self.captureOnCommitCallbacks() as callbacks:
+                trigger_sbom_tasks(sender=SBOM, instance=sbom, created=False)
+
+            self.assertEqual(callbacks, [])
 
-            # Verify no logging occurred (handlers should exit early)
+            # Verify no logging occurred (handler should exit early)
             mock_logger.info.assert_not_called()
             mock_logger.error.assert_not_called()
 
-    def test_both_signals_handle_malformed_instance(self):
-        """Test both signals handle malformed SBOM instances gracefully."""
+    def test_signal_handles_malformed_instance(self):
+        """Test the signal handler handles malformed SBOM instances gracefully."""
         # Create a mock instance that doesn't have the expected attributes
         mock_instance = Mock()
         mock_instance.id = "test-id"
-        mock_instance.component = None
+        mock_instance.component_id = None
 
         with patch('sbomify.apps.sboms.signals.logger') as mock_logger:
-            # Test NTIA compliance check
-            trigger_ntia_compliance_check(sender=SBOM, instance=mock_instance, created=True)
+            with self.captureOnCommitCallbacks(execute=True):
+                trigger_sbom_tasks(sender=SBOM, instance=mock_instance, created=True)
 
-            # Test vulnerability scan
-            trigger_vulnerability_scan(sender=SBOM, instance=mock_instance, created=True)
-
-            # Verify both functions logged errors
-            self.assertEqual(mock_logger.error.call_count, 2)
+            # Verify the error was logged once and no task was triggered
+            mock_logger.error.assert_called_once()
+            mock_logger.info.assert_not_called()
 
     def test_ntia_compliance_with_no_billing_plan(self):
         """Test NTIA compliance check with no billing plan (community users)."""
@@ -74,14 +88,21 @@ class SignalExceptionHandlingTests(TestCase):
             component=self.component
         )
 
-        with patch('sbomify.apps.sboms.signals.logger') as mock_logger:
-            trigger_ntia_compliance_check(sender=SBOM, instance=sbom, created=True)
-
-            # Should log that NTIA is skipped for community users
-            mock_logger.info.assert_called_once()
-            args, kwargs = mock_logger.info.call_args
-            self.assertIn("Skipping NTIA compliance check", args[0])
-            self.assertIn("no billing plan (community)", args[0])
+        with patch('sbomify.tasks.check_sbom_ntia_compliance') as mock_task, \
+                patch('sbomify.tasks.scan_sbom_for_vulnerabilities_unified') as mock_vuln_task, \
+                patch('sbomify.apps.sboms.signals.get_plan') as mock_get_plan:
+            with patch('sbomify.apps.sboms.signals.logger') as mock_logger:
+                with self.captureOnCommitCallbacks(execute=True):
+                    trigger_sbom_tasks(sender=SBOM, instance=sbom, created=True)
+
+                # Community teams skip the plan lookup and NTIA check, but are still scanned
+                mock_get_plan.assert_not_called()
+                mock_task.send.assert_not_called()
+                mock_vuln_task.send.assert_called_once_with(sbom.id)
+                ntia_messages = _logged_messages(mock_logger.debug, "NTIA compliance check")
+                self.assertEqual(len(ntia_messages), 1)
+                self.assertIn("Skipping NTIA compliance check", ntia_messages[0])
+                self.assertIn("no billing plan (community)", ntia_messages[0])
 
     def test_ntia_compliance_with_business_plan(self):
         """Test NTIA compliance check with business plan."""
@@ -99,19 +120,18 @@ class SignalExceptionHandlingTests(TestCase):
         )
 
         with patch('sbomify.tasks.check_sbom_ntia_compliance') as mock_task:
-            with patch('sbomify.apps.sboms.signals.logger') as mock_logger:
-                trigger_ntia_compliance_check(sender=SBOM, instance=sbom, created=True)
+            with patch('sbomify.tasks.scan_sbom_for_vulnerabilities_unified'):
+                with patch('sbomify.apps.sboms.signals.logger') as mock_logger:
+                    with self.captureOnCommitCallbacks(execute=True):
+                        trigger_sbom_tasks(sender=SBOM, instance=sbom, created=True)
 
-                # Should trigger the task
-                mock_task.send_with_options.assert_called_once_with(
-                    args=[sbom.id],
-                    delay=60000
-                )
+                    # Should trigger the task
+                    mock_task.send.assert_called_once_with(sbom.id)
 
-                # Should log that NTIA compliance is triggered
-                mock_logger.info.assert_called_once()
-                args, kwargs = mock_logger.info.call_args
-                self.assertIn("Triggering NTIA compliance check", args[0])
+                    # Should log that NTIA compliance is triggered
+                    ntia_messages = _info_messages(mock_logger, "NTIA compliance check")
+                    self.assertEqual(len(ntia_messages), 1)
+                    self.assertIn("Triggering NTIA compliance check", ntia_messages[0])
 
     def test_vulnerability_scan_always_triggered(self):
         """Test vulnerability scan is always triggered regardless of plan."""
@@ -122,18 +142,16 @@ class SignalExceptionHandlingTests(TestCase):
 
         with patch('sbomify.tasks.scan_sbom_for_vulnerabilities_unified') as mock_task:
             with patch('sbomify.apps.sboms.signals.logger') as mock_logger:
-                trigger_vulnerability_scan(sender=SBOM, instance=sbom, created=True)
+                with self.captureOnCommitCallbacks(execute=True):
+                    trigger_sbom_tasks(sender=SBOM, instance=sbom, created=True)
 
                 # Should trigger the task
-                mock_task.send_with_options.assert_called_once_with(
-                    args=[sbom.id],
-                    delay=90000
-                )
+                mock_task.send.assert_called_once_with(sbom.id)
 
                 # Should log that vulnerability scan is triggered
-                mock_logger.info.assert_called_once()
-                args, kwargs = mock_logger.info.call_args
-                self.assertIn("Triggering vulnerability scan", args[0])
+                scan_messages = _info_messages(mock_logger, "vulnerability scan")
+                self.assertEqual(len(scan_messages), 1)
+                self.assertIn("Triggering vulnerability scan", scan_messages[0])
 
     def test_vulnerability_scan_with_business_plan(self):
         """Test vulnerability scan with business plan logs plan info."""
@@ -152,18 +170,59 @@ class SignalExceptionHandlingTests(TestCase):
 
         with patch('sbomify.tasks.scan_sbom_for_vulnerabilities_unified') as mock_task:
             with patch('sbomify.apps.sboms.signals.logger') as mock_logger:
-                trigger_vulnerability_scan(sender=SBOM, instance=sbom, created=True)
+                with self.captureOnCommitCallbacks(execute=True):
+                    trigger_sbom_tasks(sender=SBOM, instance=sbom, created=True)
 
                 # Should trigger the task
-                mock_task.send_with_options.assert_called_once_with(
-                    args=[sbom.id],
-                    delay=90000
-                )
+                mock_task.send.assert_called_once_with(sbom.id)
 
                 # Should log with business plan info
-                mock_logger.info.assert_called_once()
-                args, kwargs = mock_logger.info.call_args
-                self.assertIn("'business' plan", args[0])
+                scan_messages = _info_messages(mock_logger, "vulnerability scan")
+                self.assertEqual(len(scan_messages), 1)
+                self.assertIn("'business' plan", scan_messages[0])
+
+    def test_vulnerability_scan_skips_plan_info_when_info_disabled(self):
+        """Test the scan is still queued without building its log message when INFO is disabled."""
+        sbom = SBOM.objects.create(
+            name="test-sbom",
+            component=self.component
+        )
+
+        with patch('sbomify.tasks.scan_sbom_for_vulnerabilities_unified') as mock_task:
+            with patch('sbomify.apps.sboms.signals.logger') as mock_logger:
+                mock_logger.isEnabledFor.return_value = False
+                with self.captureOnCommitCallbacks(execute=True):
+                    trigger_sbom_tasks(sender=SBOM, instance=sbom, created=True)
+
+                mock_task.send.assert_called_once_with(sbom.id)
+                self.assertEqual(_info_messages(mock_logger, "vulnerability scan"), [])
+
+    def test_billing_plan_lookup_is_cached(self):
+        """Test that the team's billing plan is served from the cache once it has been looked up."""
+        business_plan = BillingPlan.objects.create(
+            key="business",
+            name="Business Plan"
+        )
+        self.team.billing_plan = business_plan.key
+        self.team.save()
+
+        with patch('sbomify.tasks.check_sbom_ntia_compliance'):
+            with patch('sbomify.tasks.scan_sbom_for_vulnerabilities_unified'):
+                # Creating the SBOM looks the plan up for the first time
+                with self.captureOnCommitCallbacks(execute=True):
+                    sbom = SBOM.objects.create(
+                        name="test-sbom",
+                        component=self.component
+                    )
+
+                with CaptureQueriesContext(connection) as queries:
+                    with self.captureOnCommitCallbacks(execute=True):
+                        trigger_sbom_tasks(sender=SBOM, instance=sbom, created=True)
+
+        plan_table = BillingPlan._meta.db_table
+        self.assertFalse([q for q in queries.captured_queries if plan_table in q["sql"]])
+        # The team's keys are read in a single query without loading the component
+        self.assertEqual(len(queries), 1)
 
     def test_vulnerability_scan_with_nonexistent_plan(self):
         """Test vulnerability scan handles nonexistent billing plan gracefully."""
@@ -177,18 +236,16 @@ class SignalExceptionHandlingTests(TestCase):
 
         with patch('sbomify.tasks.scan_sbom_for_vulnerabilities_unified') as mock_task:
             with patch('sbomify.apps.sboms.signals.logger') as mock_logger:
-                trigger_vulnerability_scan(sender=SBOM, instance=sbom, created=True)
+                with self.captureOnCommitCallbacks(execute=True):
+                    trigger_sbom_tasks(sender=SBOM, instance=sbom, created=True)
 
                 # Should still trigger the task
-                mock_task.send_with_options.assert_called_once_with(
-                    args=[sbom.id],
-                    delay=90000
-                )
+                mock_task.send.assert_called_once_with(sbom.id)
 
                 # Should log with unknown plan info
-                mock_logger.info.assert_called_once()
-                args, _ = mock_logger.info.call_args
-                self.assertIn(f"team {self.component.team.key} with unknown plan", args[0])
+                scan_messages = _info_messages(mock_logger, "vulnerability scan")
+                self.assertEqual(len(scan_messages), 1)
+                self.assertIn(f"team {self.component.team.key} with unknown plan", scan_messages[0])
 
 
 class SignalIntegrationTests(TestCase):
@@ -210,41 +267,98 @@ class SignalIntegrationTests(TestCase):
         )
 
     def test_signals_triggered_on_sbom_creation(self):
-        """Test that both signals are triggered when an SBOM is created."""
+        """Test that both tasks are handled when an SBOM is created."""
         with patch('sbomify.tasks.scan_sbom_for_vulnerabilities_unified') as mock_vuln_task:
             with patch('sbomify.apps.sboms.signals.logger') as mock_logger:
-                # Create SBOM - this should trigger both signals
-                sbom = SBOM.objects.create(
-                    name="test-sbom",
-                    component=self.component
-                )
+                # Create SBOM - this should handle both tasks once committed
+                with self.captureOnCommitCallbacks(execute=True):
+                    sbom = SBOM.objects.create(
+                        name="test-sbom",
+                        component=self.component
+                    )
 
                 # Verify vulnerability scan was triggered
-                mock_vuln_task.send_with_options.assert_called_once_with(
-                    args=[sbom.id],
-                    delay=90000
-                )
+                mock_vuln_task.send.assert_called_once_with(sbom.id)
 
-                # Verify logging occurred for both signals
+                # Verify logging occurred for both tasks
                 info_calls = [str(call) for call in mock_logger.info.call_args_list]
+                debug_calls = [str(call) for call in mock_logger.debug.call_args_list]
                 vuln_calls = [call for call in info_calls if 'vulnerability scan' in call]
-                ntia_calls = [call for call in info_calls if 'NTIA compliance check' in call]
+                ntia_calls = [call for call in debug_calls if 'NTIA compliance check' in call]
 
                 self.assertTrue(len(vuln_calls) > 0)
                 self.assertTrue(len(ntia_calls) > 0)  # Should skip NTIA for community
 
+    def test_tasks_not_queued_before_commit(self):
+        """Test that tasks are only queued once the SBOM's transaction commits."""
+        with patch('sbomify.tasks.scan_sbom_for_vulnerabilities_unified') as mock_vuln_task:
+            with self.captureOnCommitCallbacks() as callbacks:
+                sbom = SBOM.objects.create(
+                    name="test-sbom",
+                    component=self.component
+                )
+
+                mock_vuln_task.send.assert_not_called()
+
+            self.assertEqual(len(callbacks), 1)
+            callbacks[0]()
+            mock_vuln_task.send.assert_called_once_with(sbom.id)
+
+    def test_ntia_send_failure_does_not_block_vulnerability_scan(self):
+        """Test that a broker error queueing the NTIA check still lets the vulnerability scan be queued."""
+        business_plan = BillingPlan.objects.create(
+            key="business",
+            name="Business Plan"
+        )
+        self.team.billing_plan = business_plan.key
+        self.team.save()
+
+        sbom = SBOM.objects.create(
+            name="test-sbom",
+            component=self.component
+        )
+
+        with patch('sbomify.tasks.check_sbom_ntia_compliance') as mock_task:
+            with patch('sbomify.tasks.scan_sbom_for_vulnerabilities_unified') as mock_vuln_task:
+                with patch('sbomify.apps.sboms.signals.logger') as mock_logger:
+                    mock_task.send.side_effect = RedisConnectionError("Broker unavailable")
+                    with self.captureOnCommitCallbacks(execute=True):
+                        trigger_sbom_tasks(sender=SBOM, instance=sbom, created=True)
+
+                    mock_task.send.assert_called_once_with(sbom.id)
+                    mock_vuln_task.send.assert_called_once_with(sbom.id)
+                    error_messages = _logged_messages(mock_logger.error, "NTIA compliance check")
+                    self.assertEqual(len(error_messages), 1)
+                    self.assertIn("Broker unavailable", error_messages[0])
+
     def test_exception_handling_resilience(self):
-        """Test that exceptions in signal handlers don't break SBOM creation."""
-        # Create a mock SBOM instance that will cause an exception when accessing component.team
+        """Test that exceptions in the signal handler don't break SBOM creation."""
+        # Create a mock SBOM instance whose team lookup will fail
         mock_instance = Mock()
         mock_instance.id = "test-id"
-        mock_instance.component.team.side_effect = AttributeError("Simulated error")
+        mock_instance.component_id = self.component.id
 
-        with patch('sbomify.apps.sboms.signals.logger') as mock_logger:
-            # This should not raise an exception despite the AttributeError
-            trigger_vulnerability_scan(sender=SBOM, instance=mock_instance, created=True)
+        with patch.object(Team.objects, 'filter', side_effect=DatabaseError("Simulated error")):
+            with patch('sbomify.apps.sboms.signals.logger') as mock_logger:
+                # This should not raise an exception despite the failing lookup
+                with self.captureOnCommitCallbacks(execute=True):
+                    trigger_sbom_tasks(sender=SBOM, instance=mock_instance, created=True)
+
+                # Verify error was logged
+                error_calls = [str(call) for call in mock_logger.error.call_args_list]
+                self.assertTrue(any("test-id" in call for call in error_calls))
+
+    def test_unexpected_error_does_not_fail_commit(self):
+        """Test that an unexpected error while queueing tasks doesn't propagate to the committing code."""
+        self.team.billing_plan = "business"
+        self.team.save()
+
+        with patch('sbomify.apps.sboms.signals.get_plan', side_effect=RuntimeError("Simulated bug")):
+            # This should not raise; Django logs the error from the robust on_commit callback
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                SBOM.objects.create(
+                    name="test-sbom",
+                    component=self.component
+                )
 
-            # Verify error was logged
-            error_calls = [str(call) for call in mock_logger.error.call_args_list]
-            vuln_error_calls = [call for call in error_calls if 'vulnerability scan' in call]
-            self.assertTrue(len(vuln_error_calls) > 0)
\ No newline at end of file
+        self.assertEqual(len(callbacks), 1)
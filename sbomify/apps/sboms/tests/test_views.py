@@ -586,4 +586,35 @@ def test_sbom_download_product_private_authorized(
     assert response["Content-Disposition"] == f"attachment; filename={sample_product.name}.cdx.json"
 
 
+@pytest.mark.django_db
+def test_public_pages_has_downloadable_content(
+    sample_product: Product,  # noqa: F811
+    sample_project: Project,  # noqa: F811
+    sample_sbom: SBOM,  # noqa: F811
+):
+    """Test that public product and project pages report whether any SBOM is downloadable."""
+    sample_product.is_public = True
+    sample_product.save()
+
+    sample_project.is_public = True
+    sample_project.save()
+
+    client = Client()
+
+    for uri in [
+        reverse("core:product_details_public", kwargs={"product_id": sample_product.id}),
+        reverse("core:project_details_public", kwargs={"project_id": sample_project.id}),
+    ]:
+        response: HttpResponse = client.get(uri)
+        assert response.status_code == 200
+        assert response.context["has_downloadable_content"] is True
 
+    SBOM.objects.filter(pk=sample_sbom.pk).delete()
+
+    for uri in [
+        reverse("core:product_details_public", kwargs={"product_id": sample_product.id}),
+        reverse("core:project_details_public", kwargs={"project_id": sample_project.id}),
+    ]:
+        response: HttpResponse = client.get(uri)
+        assert response.status_code == 200
+        assert response.context["has_downloadable_content"] is False
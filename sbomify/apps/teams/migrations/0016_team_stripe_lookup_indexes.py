@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2025-11-20 10:15
+
+import django.db.models.fields.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("teams", "0015_contact_profiles"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="team",
+            index=models.Index(
+                django.db.models.fields.json.KeyTransform("stripe_subscription_id", "billing_plan_limits"),
+                name="team_stripe_subscription_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="team",
+            index=models.Index(
+                django.db.models.fields.json.KeyTransform("stripe_customer_id", "billing_plan_limits"),
+                name="team_stripe_customer_idx",
+            ),
+        ),
+    ]
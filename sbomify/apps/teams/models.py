@@ -4,6 +4,7 @@ from django.apps import apps
 from django.conf import settings
 from django.core.validators import MinLengthValidator
 from django.db import models
+from django.db.models.fields.json import KeyTransform
 from django.utils import timezone
 
 from sbomify.apps.core.utils import generate_id, number_to_random_token
@@ -54,7 +55,14 @@ def get_team_name_for_user(user) -> str:
 class Team(models.Model):
     class Meta:
         db_table = apps.get_app_config("teams").label + "_teams"
-        indexes = [models.Index(fields=["key"])]
+        indexes = [
+            models.Index(fields=["key"]),
+            # Stripe webhooks resolve teams by these billing_plan_limits keys
+            models.Index(
+                KeyTransform("stripe_subscription_id", "billing_plan_limits"), name="team_stripe_subscription_idx"
+            ),
+            models.Index(KeyTransform("stripe_customer_id", "billing_plan_limits"), name="team_stripe_customer_idx"),
+        ]
         ordering = ["name"]
         constraints = [
             models.CheckConstraint(
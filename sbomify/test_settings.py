@@ -79,6 +79,9 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 
 # Add WhiteNoise compression for test similarity
 STORAGES = {
+        "default": {
+            "BACKEND": "django.core.files.storage.InMemoryStorage",
+        },
         "staticfiles": {
             "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
         },
@@ -177,6 +180,9 @@ SITE_URL = "http://testserver"
 
 INVITATION_EXPIRY_DAYS = 7
 
+# Use a fast password hasher for testing
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 # Use local memory cache for testing
 CACHES = {
     "default": {
@@ -185,4 +191,7 @@ CACHES = {
     }
 }
 
+# Keep sessions in the local memory cache instead of the database
+SESSION_ENGINE = "django.contrib.sessions.backends.cache"
+
 TESTING = True